@@ -0,0 +1,37 @@
+"""Optional mypyc compilation of hot pure-Python modules.
+
+Project metadata lives in pyproject.toml; this file only adds compiled
+extensions when explicitly requested:
+
+    BIOMCP_MYPYC=1 pip install --no-build-isolation .
+
+mypy (which ships mypyc) must be importable in the build environment. When
+the flag is unset or mypyc is unavailable, a pure-Python package is built.
+"""
+
+import os
+import warnings
+
+from setuptools import setup
+
+MYPYC_MODULES = [
+    "src/biomcp/domain_handlers.py",
+]
+
+
+def _mypyc_extensions() -> list:
+    if os.getenv("BIOMCP_MYPYC", "").lower() not in ("true", "1", "yes"):
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        warnings.warn(
+            "mypyc not available, building pure-Python package",
+            stacklevel=1,
+        )
+        return []
+    # Only the compiled modules need to type-check cleanly
+    return mypycify(["--follow-imports=silent", *MYPYC_MODULES], opt_level="3")
+
+
+setup(ext_modules=_mypyc_extensions())
@@ -1,4 +1,3 @@
-import json
 import re
 from ssl import TLSVersion
 from typing import Annotated, Any
@@ -8,6 +7,7 @@ from pydantic import BaseModel, Field, computed_field
 from .. import http_client, render
 from ..constants import PUBTATOR3_FULLTEXT_URL
 from ..http_client import RequestError
+from ..utils.json_utils import dumps_pretty
 
 
 class PassageInfo(BaseModel):
@@ -191,7 +191,7 @@ async def fetch_articles(
     if data and not output_json:
         return render.to_markdown(data)
     else:
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
 
 
 def is_doi(identifier: str) -> bool:
@@ -241,11 +241,8 @@ async def _article_details(
         )
     else:
         # Unknown identifier format
-        return json.dumps(
-            [
-                {
-                    "error": f"Invalid identifier format: {identifier}. Expected either a PMID (numeric) or DOI (10.xxxx/xxxx format)."
-                }
-            ],
-            indent=2,
-        )
+        return dumps_pretty([
+            {
+                "error": f"Invalid identifier format: {identifier}. Expected either a PMID (numeric) or DOI (10.xxxx/xxxx format)."
+            }
+        ])
@@ -1,7 +1,6 @@
 """Preprint search functionality for bioRxiv/medRxiv and Europe PMC."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Any
@@ -20,6 +19,7 @@ from ..constants import (
     SYSTEM_PAGE_SIZE,
 )
 from ..core import PublicationState
+from ..utils.json_utils import dumps_pretty
 from .search import PubmedRequest, ResultItem, SearchResponse
 
 logger = logging.getLogger(__name__)
@@ -444,7 +444,7 @@ async def fetch_europe_pmc_article(
     if data and not output_json:
         return render.to_markdown(data)
     else:
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
 
 
 async def search_preprints(
@@ -472,4 +472,4 @@ async def search_preprints(
     if data and not output_json:
         return render.to_markdown(data)
     else:
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from collections.abc import Generator
 from typing import Annotated, Any, get_args
 
@@ -8,6 +7,7 @@ from pydantic import BaseModel, Field, computed_field
 from .. import http_client, render
 from ..constants import PUBTATOR3_SEARCH_URL, SYSTEM_PAGE_SIZE
 from ..core import PublicationState
+from ..utils.json_utils import dumps_pretty
 from .autocomplete import Concept, EntityRequest, autocomplete
 from .fetch import call_pubtator_api
 
@@ -198,7 +198,7 @@ async def search_articles(
     if data and not output_json:
         return render.to_markdown(data)
     else:
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
 
 
 async def _article_searcher(
@@ -7,6 +7,7 @@ from collections.abc import Coroutine
 from typing import Any
 
 from .. import render
+from ..utils.json_utils import dumps_pretty, loads
 from .preprints import search_preprints
 from .search import PubmedRequest, search_articles
 
@@ -33,7 +34,7 @@ def _parse_search_results(results: list) -> list[dict]:
     for result in results:
         if isinstance(result, str):
             try:
-                articles = json.loads(result)
+                articles = loads(result)
                 if isinstance(articles, list):
                     all_articles.extend(articles)
             except json.JSONDecodeError:
@@ -165,7 +166,7 @@ async def search_articles_unified(  # noqa: C901
             task_labels.append("cbioportal")
 
         if not tasks:
-            return json.dumps([]) if output_json else render.to_markdown([])
+            return dumps_pretty([]) if output_json else render.to_markdown([])
 
         # Run all operations in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -210,11 +211,8 @@ async def search_articles_unified(  # noqa: C901
             return result
         else:
             if cbioportal_summary:
-                return json.dumps(
-                    {
-                        "cbioportal_summary": cbioportal_summary,
-                        "articles": unique_articles,
-                    },
-                    indent=2,
-                )
-            return json.dumps(unique_articles, indent=2)
+                return dumps_pretty({
+                    "cbioportal_summary": cbioportal_summary,
+                    "articles": unique_articles,
+                })
+            return dumps_pretty(unique_articles)
@@ -3,10 +3,56 @@
 This module centralizes cBioPortal summary generation logic to avoid duplication.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+
+from biomcp.utils.request_cache import cache_key, get_cache
 
 logger = logging.getLogger(__name__)
 
+# cBioPortal gene data changes rarely, so summaries are kept for an hour
+SUMMARY_CACHE_TTL = 3600
+_summary_cache = get_cache("cbioportal_summary", max_size=1024)
+
+# cache key -> shared task for a summary currently being built
+_inflight: dict[str, asyncio.Task[str | None]] = {}
+
+
+async def _cached_summary(
+    key: str, fetch: Callable[[], Awaitable[str | None]]
+) -> str | None:
+    """Return a cached summary, building it at most once per key.
+
+    Concurrent misses for the same key share one fetch. Failed lookups
+    (None) are not cached, so they are retried on the next call.
+    """
+    cached = await _summary_cache.get(key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(key)
+    if task is None or task.get_loop() is not loop:
+
+        async def _fetch_and_store() -> str | None:
+            summary = await fetch()
+            if summary is not None:
+                await _summary_cache.set(key, summary, SUMMARY_CACHE_TTL)
+            return summary
+
+        task = loop.create_task(_fetch_and_store())
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Task[str | None]) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+
+    # Shield so one cancelled caller does not cancel the others' fetch
+    return await asyncio.shield(task)
+
 
 async def get_cbioportal_summary_for_genes(
     genes: list[str] | None, request_params: dict | None = None
@@ -23,6 +69,16 @@ async def get_cbioportal_summary_for_genes(
     if not genes:
         return None
 
+    # Gene order matters: the summary is built for the first gene
+    key = cache_key("genes", *genes, **(request_params or {}))
+    return await _cached_summary(
+        key, lambda: _fetch_gene_summary(genes, request_params)
+    )
+
+
+async def _fetch_gene_summary(
+    genes: list[str], request_params: dict | None
+) -> str | None:
     try:
         from biomcp.articles.search import PubmedRequest
         from biomcp.articles.unified import _get_cbioportal_summary
@@ -56,6 +112,12 @@ async def get_variant_cbioportal_summary(gene: str | None) -> str | None:
     if not gene:
         return None
 
+    return await _cached_summary(
+        cache_key("variant", gene), lambda: _fetch_variant_summary(gene)
+    )
+
+
+async def _fetch_variant_summary(gene: str) -> str | None:
     try:
         from biomcp.variants.cbioportal_search import (
             CBioPortalSearchClient,
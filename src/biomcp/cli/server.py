@@ -18,8 +18,24 @@ class ServerMode(str, Enum):
     STREAMABLE_HTTP = "streamable_http"
 
 
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when uvloop is installed.
+
+    uvloop is optional; without it the default asyncio loop is used.
+    uvicorn already picks uvloop up on its own for the HTTP modes.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
 def run_stdio_server():
     """Run server in STDIO mode."""
+    if install_uvloop():
+        logger.info("Using uvloop event loop")
     logger.info("Starting MCP server with STDIO transport:")
     mcp_app.run(transport="stdio")
 
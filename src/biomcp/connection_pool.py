@@ -23,15 +23,74 @@ Example:
 
 Environment Variables:
     BIOMCP_USE_CONNECTION_POOL: Enable/disable pooling (default: "true")
+    BIOMCP_HTTP2: Use HTTP/2 for hosts in HTTP2_HOSTS when the optional
+        h2 package is installed (default: "true")
+
+When aiohttp is installed, get_aiohttp_session() provides the equivalent
+per-loop session pool for the optional aiohttp request backend.
 """
 
 import asyncio
+import functools
+import importlib.util
+import os
 import ssl
 import weakref
+from urllib.parse import urlsplit
 
 # NOTE: httpx import is allowed in this file for connection pooling infrastructure
 import httpx
 
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# httpx needs the optional h2 package for http2=True
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upstream hosts that negotiate HTTP/2; each gets its own multiplexed pool
+HTTP2_HOSTS = frozenset({
+    "clinicaltrials.gov",  # ClinicalTrials.gov API
+    "www.ncbi.nlm.nih.gov",  # PubTator3 (PubMed)
+    "myvariant.info",  # MyVariant.info
+})
+
+
+@functools.cache
+def shared_ssl_context(verify: str | bool) -> ssl.SSLContext:
+    """Return one SSLContext per verify setting, built the way httpx does.
+
+    httpx otherwise builds a context per client, and loading the CA
+    bundle for verify=True takes around 100ms.
+    """
+    return httpx.create_ssl_context(verify=verify)
+
+
+def resolve_verify(verify: ssl.SSLContext | str | bool) -> ssl.SSLContext:
+    """Map an httpx-style verify setting to a shared SSLContext."""
+    if isinstance(verify, ssl.SSLContext):
+        return verify
+    return shared_ssl_context(verify)
+
+
+@functools.lru_cache(maxsize=256)
+def url_host(url: str) -> str | None:
+    """Return the URL's hostname, memoized for the small set of endpoints."""
+    return urlsplit(url).hostname
+
+
+def http2_host(url: str) -> str | None:
+    """Return the URL's host if requests to it should use HTTP/2."""
+    if not HTTP2_AVAILABLE:
+        return None
+    if os.getenv("BIOMCP_HTTP2", "true").lower() not in ("true", "1", "yes"):
+        return None
+    host = url_host(url)
+    return host if host in HTTP2_HOSTS else None
+
 
 class EventLoopConnectionPools:
     """Manages connection pools per event loop.
@@ -53,14 +112,32 @@ class EventLoopConnectionPools:
         self._lock = asyncio.Lock()
 
     async def get_pool(
-        self, verify: ssl.SSLContext | str | bool, timeout: httpx.Timeout
+        self,
+        verify: ssl.SSLContext | str | bool,
+        timeout: httpx.Timeout,
+        http2_host: str | None = None,
     ) -> httpx.AsyncClient:
-        """Get or create a connection pool for the current event loop."""
+        """Get or create a connection pool for the current event loop.
+
+        HTTP/1.1 requests share one pool per verify setting; passing
+        http2_host selects a dedicated HTTP/2 pool for that host.
+        """
+        http2 = http2_host is not None
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             # No event loop running, return a single-use client
-            return self._create_client(verify, timeout, pooled=False)
+            return self._create_client(
+                verify, timeout, pooled=False, http2=http2
+            )
+
+        # Fast path: reuse an open pool without taking the lock
+        pool_key = self._get_pool_key(verify, http2_host)
+        pools = self._loop_pools.get(loop)
+        if pools is not None:
+            pool = pools.get(pool_key)
+            if pool is not None and not pool.is_closed:
+                return pool
 
         # Get or create pools dict for this event loop
         async with self._lock:
@@ -70,31 +147,48 @@ class EventLoopConnectionPools:
                 self._register_loop_cleanup(loop)
 
             pools = self._loop_pools[loop]
-            pool_key = self._get_pool_key(verify)
 
-            # Check if we have a valid pool
+            # Another task may have created it while we waited
             if pool_key in pools and not pools[pool_key].is_closed:
                 return pools[pool_key]
 
             # Create new pool
-            client = self._create_client(verify, timeout, pooled=True)
+            client = self._create_client(
+                verify, timeout, pooled=True, http2=http2
+            )
             pools[pool_key] = client
             return client
 
-    def _get_pool_key(self, verify: ssl.SSLContext | str | bool) -> str:
+    def _get_pool_key(
+        self,
+        verify: ssl.SSLContext | str | bool,
+        http2_host: str | None = None,
+    ) -> str:
         """Generate a key for the connection pool."""
         if isinstance(verify, ssl.SSLContext):
-            return f"ssl_{id(verify)}"
-        return str(verify)
+            key = f"ssl_{id(verify)}"
+        else:
+            key = str(verify)
+        if http2_host:
+            key = f"{key}:h2:{http2_host}"
+        return key
 
     def _create_client(
         self,
         verify: ssl.SSLContext | str | bool,
         timeout: httpx.Timeout,
         pooled: bool = True,
+        http2: bool = False,
     ) -> httpx.AsyncClient:
         """Create a new HTTP client."""
-        if pooled:
+        if pooled and http2:
+            # Each connection multiplexes many streams; a few suffice
+            limits = httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=8,
+                keepalive_expiry=30,
+            )
+        elif pooled:
             limits = httpx.Limits(
                 max_keepalive_connections=20,
                 max_connections=100,
@@ -105,8 +199,8 @@ class EventLoopConnectionPools:
             limits = httpx.Limits(max_keepalive_connections=0)
 
         return httpx.AsyncClient(
-            verify=verify,
-            http2=False,  # HTTP/2 can add overhead
+            verify=resolve_verify(verify),
+            http2=http2,  # Only for hosts known to negotiate HTTP/2
             timeout=timeout,
             limits=limits,
         )
@@ -155,15 +249,67 @@ class EventLoopConnectionPools:
 # Global instance
 _pool_manager = EventLoopConnectionPools()
 
+# aiohttp sessions per event loop, keyed like the httpx pools
+_aiohttp_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _aiohttp_ssl(
+    verify: ssl.SSLContext | str | bool,
+) -> ssl.SSLContext | bool:
+    """Translate an httpx-style verify setting for aiohttp."""
+    if isinstance(verify, str):
+        return shared_ssl_context(verify)
+    return verify
+
+
+def get_aiohttp_session(
+    verify: ssl.SSLContext | str | bool,
+) -> "aiohttp.ClientSession":
+    """Get or create an aiohttp session for the current event loop.
+
+    Must be called from a running event loop. Sessions use the same
+    limits as the httpx pools (100 connections, 20 per host, 30s
+    keep-alive).
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _aiohttp_sessions.setdefault(loop, {})
+    pool_key = _pool_manager._get_pool_key(verify)
+
+    session = sessions.get(pool_key)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ssl=_aiohttp_ssl(verify),
+            keepalive_timeout=30,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        sessions[pool_key] = session
+    return session
+
 
 async def get_connection_pool(
     verify: ssl.SSLContext | str | bool,
     timeout: httpx.Timeout,
+    http2_host: str | None = None,
 ) -> httpx.AsyncClient:
     """Get a connection pool for the current event loop."""
-    return await _pool_manager.get_pool(verify, timeout)
+    return await _pool_manager.get_pool(verify, timeout, http2_host)
 
 
 async def close_all_pools():
     """Close all connection pools."""
     await _pool_manager.close_all()
+
+    sessions = [
+        session
+        for loop_sessions in _aiohttp_sessions.values()
+        for session in loop_sessions.values()
+        if not session.closed
+    ]
+    if sessions:
+        await asyncio.gather(
+            *(session.close() for session in sessions),
+            return_exceptions=True,
+        )
+    _aiohttp_sessions.clear()
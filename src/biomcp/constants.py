@@ -99,6 +99,7 @@ DEFAULT_RATE_LIMIT_PER_SECOND = 10.0
 DEFAULT_BURST_SIZE = 20
 SLIDING_WINDOW_MINUTE_LIMIT = 60
 SLIDING_WINDOW_HOUR_LIMIT = 1000
+DEFAULT_HOST_CONCURRENCY = 32  # In-flight requests per upstream host
 
 # Retry Configuration
 DEFAULT_MAX_RETRY_ATTEMPTS = 3
@@ -119,6 +120,9 @@ MAX_METRIC_SAMPLES = 1000
 METRIC_PERCENTILE_50 = 0.50
 METRIC_PERCENTILE_95 = 0.95
 METRIC_PERCENTILE_99 = 0.99
+METRIC_SLOW_CALL_FACTOR = 2.0  # Warn when a call exceeds P95 by this factor
+METRIC_SLOW_CALL_MIN_SAMPLES = 20  # Samples needed before warning
+METRIC_SLOW_CALL_REFRESH = 50  # Recompute the P95 every N samples
 METRIC_JITTER_RANGE = 0.1  # 10% jitter
 
 # HTTP Client Configuration
@@ -144,6 +148,9 @@ PREFETCH_TIMEOUT = 2.0
 # Cache Configuration
 REQUEST_CACHE_MAX_SIZE = 1000
 CACHE_KEY_SAMPLE_SIZE = 100
+# Rendered gene/disease/drug details (reference data, slow to change)
+DETAILS_CACHE_TTL = 60 * 60 * 24  # 1 day in seconds
+DETAILS_CACHE_MAX_SIZE = 1024
 
 # Connection Pool Configuration
 CONNECTION_POOL_MAX_KEEPALIVE = 20
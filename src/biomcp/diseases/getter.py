@@ -1,16 +1,21 @@
 """Disease information retrieval from MyDisease.info."""
 
-import json
 import logging
 from typing import Annotated
 
 from pydantic import Field
 
+from ..constants import DETAILS_CACHE_MAX_SIZE, DETAILS_CACHE_TTL
 from ..integrations import BioThingsClient
 from ..render import to_markdown
+from ..utils.json_utils import dumps_pretty
+from ..utils.request_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Successful results only; errors and misses are always fetched again
+_disease_cache = get_cache("disease_details", max_size=DETAILS_CACHE_MAX_SIZE)
+
 
 def _add_disease_links(disease_info, result: dict) -> None:
     """Add helpful links to disease result."""
@@ -97,6 +102,12 @@ async def get_disease(
     Returns:
         Disease information as markdown or JSON string
     """
+    cache_key = f"{disease_id_or_name}:{output_json}"
+    cached = await _disease_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Disease details cache hit for {disease_id_or_name}")
+        return cached
+
     client = BioThingsClient()
 
     try:
@@ -108,7 +119,7 @@ async def get_disease(
                 "suggestion": "Please check the disease name or ID (MONDO:, DOID:, OMIM:, MESH:)",
             }
             return (
-                json.dumps(error_data, indent=2)
+                dumps_pretty(error_data)
                 if output_json
                 else to_markdown([error_data])
             )
@@ -122,10 +133,7 @@ async def get_disease(
         # Format output for display
         _format_disease_output(disease_info, result)
 
-        if output_json:
-            return json.dumps(result, indent=2)
-        else:
-            return to_markdown([result])
+        output = dumps_pretty(result) if output_json else to_markdown([result])
 
     except Exception as e:
         logger.error(
@@ -136,11 +144,14 @@ async def get_disease(
             "details": str(e),
         }
         return (
-            json.dumps(error_data, indent=2)
+            dumps_pretty(error_data)
             if output_json
             else to_markdown([error_data])
         )
 
+    await _disease_cache.set(cache_key, output, DETAILS_CACHE_TTL)
+    return output
+
 
 async def _disease_details(
     call_benefit: Annotated[
@@ -2,12 +2,19 @@
 
 This module contains formatting functions for converting raw API responses
 from different biomedical data sources into a standardized format.
+
+Result dictionaries are built as single dict literals rather than by copying
+a pre-sized template; the literal form benchmarks faster on CPython 3.11+.
 """
 
 import logging
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from biomcp.constants import (
+    CLINICAL_TRIALS_STUDY_URL,
+    DBSNP_BASE_URL,
     DEFAULT_SIGNIFICANCE,
     DEFAULT_TITLE,
     METADATA_AUTHORS,
@@ -22,6 +29,7 @@ from biomcp.constants import (
     METADATA_START_DATE,
     METADATA_STATUS,
     METADATA_YEAR,
+    PUBMED_BASE_URL,
     RESULT_ID,
     RESULT_METADATA,
     RESULT_SNIPPET,
@@ -32,157 +40,348 @@ from biomcp.constants import (
 
 logger = logging.getLogger(__name__)
 
+MAX_AUTHORS_IN_METADATA = 3
+
+# Snippet labels shared by the NCI handlers
+TYPE_LABEL = "Type: "
+LOCATION_LABEL = "Location: "
+ALSO_KNOWN_AS_LABEL = "Also known as: "
+ASSAY_LABEL = "Assay: "
+CATEGORY_LABEL = "Category: "
+SNIPPET_SEPARATOR = " | "
+
+
+def _first_value(result: dict[str, Any], *keys: str, default: Any = "") -> Any:
+    """Return the first non-empty value found under keys, or the default."""
+    for key in keys:
+        value = result.get(key)
+        if value:
+            return value
+    return default
+
+
+def _snippet(text: str | None) -> str:
+    """Truncate text to the snippet length, marking cuts with "..."."""
+    if not text:
+        return ""
+    if len(text) > SNIPPET_LENGTH:
+        return text[:SNIPPET_LENGTH] + "..."
+    return text
+
+
+def _join_snippet(first: str, second: str, default: str) -> str:
+    """Join two optional snippet fragments, falling back to a default."""
+    if first and second:
+        return first + SNIPPET_SEPARATOR + second
+    return first or second or default
+
+
+def _synonyms_snippet(synonyms: Any, count_remaining: bool = False) -> str:
+    """Build the 'Also known as' fragment from a synonym list or string."""
+    if isinstance(synonyms, str):
+        return ALSO_KNOWN_AS_LABEL + synonyms if synonyms else ""
+    if not isinstance(synonyms, list) or not synonyms:
+        return ""
+    fragment = ALSO_KNOWN_AS_LABEL + ", ".join(synonyms[:3])
+    if count_remaining and len(synonyms) > 3:
+        fragment += f"{SNIPPET_SEPARATOR}and {len(synonyms) - 3} more"
+    return fragment
+
+
+def _first_authors(result: dict[str, Any]) -> list:
+    """Return the leading authors, reusing the list when already short."""
+    authors = result.get("authors") or []
+    if len(authors) > MAX_AUTHORS_IN_METADATA:
+        return authors[:MAX_AUTHORS_IN_METADATA]
+    return authors
+
+
+def _article_result(
+    result: dict[str, Any],
+    article_id: Any,
+    title: Any,
+    snippet: str,
+    url: Any,
+    year: Any,
+    source_key: str,
+    source: Any,
+    include_metadata: bool,
+) -> dict[str, Any]:
+    """Build the standardized result shared by PubMed and preprint articles."""
+    formatted = {
+        RESULT_ID: article_id,
+        RESULT_TITLE: title,
+        RESULT_SNIPPET: snippet,
+        RESULT_URL: url,
+    }
+    if include_metadata:
+        formatted[RESULT_METADATA] = {
+            METADATA_YEAR: year,
+            source_key: source,
+            METADATA_AUTHORS: _first_authors(result),
+        }
+    return formatted
+
+
+def _format_pubmed_article(
+    result: dict[str, Any], include_metadata: bool = True
+) -> dict[str, Any]:
+    """Format a PubMed article from PubTator3."""
+    pmid = result["pmid"]
+
+    # Clean up title - remove extra spaces
+    title = result.get("title", "").strip()
+    title = " ".join(title.split())  # Normalize whitespace
+
+    date = result.get("date")
+    return _article_result(
+        result,
+        article_id=pmid,
+        title=title or DEFAULT_TITLE,
+        snippet=_snippet(result.get("abstract")),
+        url=f"{PUBMED_BASE_URL}{pmid}/",
+        year=result.get("pub_year") or (date[:4] if date else None),
+        source_key=METADATA_JOURNAL,
+        source=result.get("journal", ""),
+        include_metadata=include_metadata,
+    )
+
+
+def _format_preprint(
+    result: dict[str, Any], include_metadata: bool = True
+) -> dict[str, Any]:
+    """Format a preprint search result."""
+    return _article_result(
+        result,
+        article_id=_first_value(result, "doi", "id"),
+        title=result.get("title", ""),
+        snippet=_snippet(result.get("abstract")),
+        url=result.get("url", ""),
+        year=result.get("pub_year"),
+        source_key=METADATA_SOURCE,
+        source=result.get("source", ""),
+        include_metadata=include_metadata,
+    )
+
+
+def _format_batch(
+    format_result: Callable[..., dict[str, Any]],
+    results: list[dict[str, Any]],
+    include_metadata: bool,
+) -> list[dict[str, Any]]:
+    """Apply a handler's format_result to every result in a batch."""
+    return [
+        format_result(result, include_metadata=include_metadata)
+        for result in results
+    ]
+
 
 class ArticleHandler:
     """Handles formatting for article/publication results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single article result.
 
         Args:
             result: Raw article data from PubTator3 or preprint APIs
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized article result with id, title, snippet, url, and metadata
         """
         if "pmid" in result:
-            # PubMed article
-            # Clean up title - remove extra spaces
-            title = result.get("title", "").strip()
-            title = " ".join(title.split())  # Normalize whitespace
-
-            # Use default if empty
-            if not title:
-                title = DEFAULT_TITLE
-
-            return {
-                RESULT_ID: result["pmid"],
-                RESULT_TITLE: title,
-                RESULT_SNIPPET: result.get("abstract", "")[:SNIPPET_LENGTH]
-                if result.get("abstract")
-                else "",
-                RESULT_URL: f"https://pubmed.ncbi.nlm.nih.gov/{result['pmid']}/",
-                RESULT_METADATA: {
-                    METADATA_YEAR: result.get("pub_year")
-                    or (
-                        result.get("date", "")[:4]
-                        if result.get("date")
-                        else None
-                    ),
-                    METADATA_JOURNAL: result.get("journal", ""),
-                    METADATA_AUTHORS: result.get("authors", [])[:3],
-                },
-            }
-        else:
-            # Preprint result
-            return {
-                RESULT_ID: result.get("doi", result.get("id", "")),
-                RESULT_TITLE: result.get("title", ""),
-                RESULT_SNIPPET: result.get("abstract", "")[:SNIPPET_LENGTH]
-                + "..."
-                if result.get("abstract")
-                else "",
-                RESULT_URL: result.get("url", ""),
-                RESULT_METADATA: {
-                    METADATA_YEAR: result.get("pub_year"),
-                    METADATA_SOURCE: result.get("source", ""),
-                    METADATA_AUTHORS: result.get("authors", [])[:3],
-                },
-            }
+            return _format_pubmed_article(result, include_metadata)
+        return _format_preprint(result, include_metadata)
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of article results in order."""
+        return _format_batch(
+            ArticleHandler.format_result, results, include_metadata
+        )
+
+
+def _trial_result(
+    nct_id: Any,
+    title: Any,
+    brief_summary: Any,
+    overall_status: Any,
+    phase: Any,
+    start_date: Any,
+    completion_date: Any,
+    include_metadata: bool,
+) -> dict[str, Any]:
+    """Build the standardized result shared by all trial formats."""
+    formatted = {
+        RESULT_ID: nct_id,
+        RESULT_TITLE: title,
+        RESULT_SNIPPET: _snippet(brief_summary),
+        RESULT_URL: f"{CLINICAL_TRIALS_STUDY_URL}{nct_id}",
+    }
+    if include_metadata:
+        formatted[RESULT_METADATA] = {
+            METADATA_STATUS: overall_status,
+            METADATA_PHASE: phase,
+            METADATA_START_DATE: start_date,
+            METADATA_COMPLETION_DATE: completion_date,
+        }
+    return formatted
+
+
+def _format_trial_v2(
+    result: dict[str, Any], include_metadata: bool = True
+) -> dict[str, Any]:
+    """Format a trial in the ClinicalTrials.gov API v2 nested structure."""
+    protocol = result.get("protocolSection", {})
+    identification = protocol.get("identificationModule", {})
+    status = protocol.get("statusModule", {})
+    description = protocol.get("descriptionModule", {})
+
+    # Extract phase from designModule
+    phases = protocol.get("designModule", {}).get("phases", [])
+
+    return _trial_result(
+        nct_id=identification.get("nctId", ""),
+        title=identification.get("briefTitle", "")
+        or identification.get("officialTitle", "")
+        or DEFAULT_TITLE,
+        brief_summary=description.get("briefSummary", ""),
+        overall_status=status.get("overallStatus", ""),
+        phase=phases[0] if phases else "",
+        start_date=status.get("startDateStruct", {}).get("date", ""),
+        completion_date=status.get("primaryCompletionDateStruct", {}).get(
+            "date", ""
+        ),
+        include_metadata=include_metadata,
+    )
+
+
+def _format_trial_legacy_flat(
+    result: dict[str, Any], include_metadata: bool = True
+) -> dict[str, Any]:
+    """Format a trial in the legacy flat format from search results."""
+    return _trial_result(
+        nct_id=result.get("NCT Number", ""),
+        # Official title is not available in this format
+        title=result.get("Study Title", "") or DEFAULT_TITLE,
+        brief_summary=result.get("Brief Summary", ""),
+        overall_status=result.get("Study Status", ""),
+        phase=result.get("Phases", ""),
+        start_date=result.get("Start Date", ""),
+        completion_date=result.get("Completion Date", ""),
+        include_metadata=include_metadata,
+    )
+
+
+def _format_trial_legacy_nested(
+    result: dict[str, Any], include_metadata: bool = True
+) -> dict[str, Any]:
+    """Format a trial in the original legacy or simplified structure."""
+    return _trial_result(
+        nct_id=result.get("nct_id", ""),
+        title=result.get("brief_title", "")
+        or result.get("official_title", "")
+        or DEFAULT_TITLE,
+        brief_summary=result.get("brief_summary", ""),
+        overall_status=result.get("overall_status", ""),
+        phase=result.get("phase", ""),
+        start_date=result.get("start_date", ""),
+        completion_date=result.get("primary_completion_date", ""),
+        include_metadata=include_metadata,
+    )
 
 
 class TrialHandler:
     """Handles formatting for clinical trial results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def select_formatter(
+        result: dict[str, Any],
+    ) -> Callable[..., dict[str, Any]]:
+        """Choose the trial formatter matching the shape of a raw result.
+
+        Args:
+            result: Raw trial data from ClinicalTrials.gov API
+
+        Returns:
+            Formatter for the ClinicalTrials.gov API v2, legacy flat, or
+            legacy nested structure
+        """
+        if "protocolSection" in result:
+            return _format_trial_v2
+        if "NCT Number" in result:
+            return _format_trial_legacy_flat
+        return _format_trial_legacy_nested
+
+    @staticmethod
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single trial result.
 
         Handles both ClinicalTrials.gov API v2 nested structure and legacy formats.
 
         Args:
             result: Raw trial data from ClinicalTrials.gov API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized trial result with id, title, snippet, url, and metadata
         """
-        # Handle ClinicalTrials.gov API v2 nested structure
-        if "protocolSection" in result:
-            # API v2 format - extract from nested modules
-            protocol = result.get("protocolSection", {})
-            identification = protocol.get("identificationModule", {})
-            status = protocol.get("statusModule", {})
-            description = protocol.get("descriptionModule", {})
-
-            nct_id = identification.get("nctId", "")
-            brief_title = identification.get("briefTitle", "")
-            official_title = identification.get("officialTitle", "")
-            brief_summary = description.get("briefSummary", "")
-            overall_status = status.get("overallStatus", "")
-            start_date = status.get("startDateStruct", {}).get("date", "")
-            completion_date = status.get(
-                "primaryCompletionDateStruct", {}
-            ).get("date", "")
-
-            # Extract phase from designModule
-            design = protocol.get("designModule", {})
-            phases = design.get("phases", [])
-            phase = phases[0] if phases else ""
-        elif "NCT Number" in result:
-            # Legacy flat format from search results
-            nct_id = result.get("NCT Number", "")
-            brief_title = result.get("Study Title", "")
-            official_title = ""  # Not available in this format
-            brief_summary = result.get("Brief Summary", "")
-            overall_status = result.get("Study Status", "")
-            phase = result.get("Phases", "")
-            start_date = result.get("Start Date", "")
-            completion_date = result.get("Completion Date", "")
-        else:
-            # Original legacy format or simplified structure
-            nct_id = result.get("nct_id", "")
-            brief_title = result.get("brief_title", "")
-            official_title = result.get("official_title", "")
-            brief_summary = result.get("brief_summary", "")
-            overall_status = result.get("overall_status", "")
-            phase = result.get("phase", "")
-            start_date = result.get("start_date", "")
-            completion_date = result.get("primary_completion_date", "")
-
-        return {
-            RESULT_ID: nct_id,
-            RESULT_TITLE: brief_title or official_title or DEFAULT_TITLE,
-            RESULT_SNIPPET: brief_summary[:SNIPPET_LENGTH]
-            if brief_summary
-            else "",
-            RESULT_URL: f"https://clinicaltrials.gov/study/{nct_id}",
-            RESULT_METADATA: {
-                METADATA_STATUS: overall_status,
-                METADATA_PHASE: phase,
-                METADATA_START_DATE: start_date,
-                METADATA_COMPLETION_DATE: completion_date,
-            },
-        }
+        return TrialHandler.select_formatter(result)(result, include_metadata)
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of trial results sharing the same structure.
+
+        The structure is detected once from the first result rather than
+        for every trial in the batch.
+
+        Args:
+            results: Raw trial data from a single ClinicalTrials.gov response
+            include_metadata: Whether to build the metadata sub-dict
+
+        Returns:
+            Standardized trial results in the same order
+        """
+        if not results:
+            return []
+        formatter = TrialHandler.select_formatter(results[0])
+        return [formatter(result, include_metadata) for result in results]
 
 
 class VariantHandler:
     """Handles formatting for genetic variant results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single variant result.
 
         Args:
             result: Raw variant data from MyVariant.info API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized variant result with id, title, snippet, url, and metadata
         """
+        variant_id = result.get("_id", "")
+        # Bind each sub-record once; "or {}" also covers explicit nulls
+        dbnsfp = result.get("dbnsfp") or {}
+        dbsnp = result.get("dbsnp") or {}
+
         # Extract gene symbol - MyVariant.info stores this in multiple locations
         gene = (
-            result.get("dbnsfp", {}).get("genename", "")
-            or result.get("dbsnp", {}).get("gene", {}).get("symbol", "")
+            dbnsfp.get("genename")
+            or (dbsnp.get("gene") or {}).get("symbol")
             or ""
         )
         # Handle case where gene is a list
@@ -190,61 +389,75 @@ class VariantHandler:
             gene = gene[0] if gene else ""
 
         # Extract rsid
-        rsid = result.get("dbsnp", {}).get("rsid", "") or ""
+        rsid = dbsnp.get("rsid", "") or ""
 
         # Extract clinical significance
-        clinvar = result.get("clinvar", {})
-        significance = ""
-        if isinstance(clinvar.get("rcv"), dict):
-            significance = clinvar["rcv"].get("clinical_significance", "")
-        elif isinstance(clinvar.get("rcv"), list) and clinvar["rcv"]:
-            significance = clinvar["rcv"][0].get("clinical_significance", "")
+        rcv = (result.get("clinvar") or {}).get("rcv")
+        significance: Any = ""
+        if isinstance(rcv, dict):
+            significance = rcv.get("clinical_significance", "")
+        elif isinstance(rcv, list) and rcv:
+            significance = rcv[0].get("clinical_significance", "")
 
         # Build a meaningful title
-        hgvs = ""
-        if "dbnsfp" in result and "hgvsp" in result["dbnsfp"]:
-            hgvs = result["dbnsfp"]["hgvsp"]
+        hgvs: Any = ""
+        if "hgvsp" in dbnsfp:
+            hgvs = dbnsfp["hgvsp"]
             if isinstance(hgvs, list):
                 hgvs = hgvs[0] if hgvs else ""
 
-        title = f"{gene} {hgvs}".strip() or result.get("_id", DEFAULT_TITLE)
+        title = f"{gene} {hgvs}".strip() or variant_id or DEFAULT_TITLE
 
-        return {
-            RESULT_ID: result.get("_id", ""),
+        formatted = {
+            RESULT_ID: variant_id,
             RESULT_TITLE: title,
             RESULT_SNIPPET: f"Clinical significance: {significance or DEFAULT_SIGNIFICANCE}",
-            RESULT_URL: f"https://www.ncbi.nlm.nih.gov/snp/{rsid}"
-            if rsid
-            else "",
-            RESULT_METADATA: {
+            RESULT_URL: f"{DBSNP_BASE_URL}{rsid}" if rsid else "",
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 METADATA_GENE: gene,
                 METADATA_RSID: rsid,
                 METADATA_SIGNIFICANCE: significance,
-                METADATA_CONSEQUENCE: result.get("cadd", {}).get(
+                METADATA_CONSEQUENCE: (result.get("cadd") or {}).get(
                     "consequence", ""
                 ),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of variant results in order."""
+        return _format_batch(
+            VariantHandler.format_result, results, include_metadata
+        )
 
 
 class GeneHandler:
     """Handles formatting for gene information results from MyGene.info."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single gene result.
 
         Args:
             result: Raw gene data from MyGene.info API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized gene result with id, title, snippet, url, and metadata
         """
         # Extract gene information
-        gene_id = result.get("_id", result.get("entrezgene", ""))
+        entrezgene = result.get("entrezgene")
+        gene_id = result.get("_id") or entrezgene or ""
         symbol = result.get("symbol", "")
         name = result.get("name", "")
         summary = result.get("summary", "")
+        ensembl = result.get("ensembl")
 
         # Build title
         title = (
@@ -254,41 +467,51 @@ class GeneHandler:
         )
 
         # Create snippet from summary
-        snippet = (
-            summary[:SNIPPET_LENGTH] + "..."
-            if summary and len(summary) > SNIPPET_LENGTH
-            else summary
-        )
+        snippet = _snippet(summary)
 
-        return {
+        formatted = {
             RESULT_ID: str(gene_id),
             RESULT_TITLE: title,
             RESULT_SNIPPET: snippet or "No summary available",
             RESULT_URL: f"https://www.genenames.org/data/gene-symbol-report/#!/symbol/{symbol}"
             if symbol
             else "",
-            RESULT_METADATA: {
-                "entrezgene": result.get("entrezgene"),
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
+                "entrezgene": entrezgene,
                 "symbol": symbol,
                 "name": name,
                 "type_of_gene": result.get("type_of_gene", ""),
-                "ensembl": result.get("ensembl", {}).get("gene")
-                if isinstance(result.get("ensembl"), dict)
+                "ensembl": ensembl.get("gene")
+                if isinstance(ensembl, dict)
                 else None,
                 "refseq": result.get("refseq", {}),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of gene results in order."""
+        return _format_batch(
+            GeneHandler.format_result, results, include_metadata
+        )
 
 
 class DrugHandler:
     """Handles formatting for drug/chemical information results from MyChem.info."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single drug result.
 
         Args:
             result: Raw drug data from MyChem.info API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized drug result with id, title, snippet, url, and metadata
@@ -299,50 +522,61 @@ class DrugHandler:
         drugbank_id = result.get("drugbank_id", "")
         description = result.get("description", "")
         indication = result.get("indication", "")
+        pubchem_cid = result.get("pubchem_cid", "")
 
         # Build title
         title = name or drug_id or DEFAULT_TITLE
 
         # Create snippet from description or indication
         snippet_text = indication or description
-        snippet = (
-            snippet_text[:SNIPPET_LENGTH] + "..."
-            if snippet_text and len(snippet_text) > SNIPPET_LENGTH
-            else snippet_text
-        )
+        snippet = _snippet(snippet_text)
 
         # Determine URL based on available IDs
         url = ""
         if drugbank_id:
             url = f"https://www.drugbank.ca/drugs/{drugbank_id}"
-        elif result.get("pubchem_cid"):
-            url = f"https://pubchem.ncbi.nlm.nih.gov/compound/{result['pubchem_cid']}"
+        elif pubchem_cid:
+            url = f"https://pubchem.ncbi.nlm.nih.gov/compound/{pubchem_cid}"
 
-        return {
+        formatted = {
             RESULT_ID: drug_id,
             RESULT_TITLE: title,
             RESULT_SNIPPET: snippet or "No description available",
             RESULT_URL: url,
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "drugbank_id": drugbank_id,
                 "chembl_id": result.get("chembl_id", ""),
-                "pubchem_cid": result.get("pubchem_cid", ""),
+                "pubchem_cid": pubchem_cid,
                 "chebi_id": result.get("chebi_id", ""),
                 "formula": result.get("formula", ""),
                 "tradename": result.get("tradename", []),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of drug results in order."""
+        return _format_batch(
+            DrugHandler.format_result, results, include_metadata
+        )
 
 
 class DiseaseHandler:
     """Handles formatting for disease information results from MyDisease.info."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single disease result.
 
         Args:
             result: Raw disease data from MyDisease.info API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized disease result with id, title, snippet, url, and metadata
@@ -357,11 +591,7 @@ class DiseaseHandler:
         title = name or disease_id or DEFAULT_TITLE
 
         # Create snippet from definition
-        snippet = (
-            definition[:SNIPPET_LENGTH] + "..."
-            if definition and len(definition) > SNIPPET_LENGTH
-            else definition
-        )
+        snippet = _snippet(definition)
 
         # Extract MONDO ID for URL
         mondo_id = mondo_info.get("id") if isinstance(mondo_info, dict) else ""
@@ -371,127 +601,161 @@ class DiseaseHandler:
             else ""
         )
 
-        return {
+        formatted = {
             RESULT_ID: disease_id,
             RESULT_TITLE: title,
             RESULT_SNIPPET: snippet or "No definition available",
             RESULT_URL: url,
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "mondo_id": mondo_id,
                 "definition": definition,
                 "synonyms": result.get("synonyms", []),
                 "xrefs": result.get("xrefs", {}),
                 "phenotypes": len(result.get("phenotypes", [])),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of disease results in order."""
+        return _format_batch(
+            DiseaseHandler.format_result, results, include_metadata
+        )
 
 
 class NCIOrganizationHandler:
     """Handles formatting for NCI organization results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single NCI organization result.
 
         Args:
             result: Raw organization data from NCI CTS API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized organization result with id, title, snippet, url, and metadata
         """
-        org_id = result.get("id", result.get("org_id", ""))
-        name = result.get("name", "Unknown Organization")
-        org_type = result.get("type", result.get("category", ""))
+        org_id = _first_value(result, "id", "org_id")
+        name = result.get("name") or "Unknown Organization"
+        org_type = _first_value(result, "type", "category")
         city = result.get("city", "")
         state = result.get("state", "")
 
         # Build location string
-        location_parts = [p for p in [city, state] if p]
-        location = ", ".join(location_parts) if location_parts else ""
+        location = city + ", " + state if city and state else city or state
 
         # Create snippet
-        snippet_parts = []
-        if org_type:
-            snippet_parts.append(f"Type: {org_type}")
-        if location:
-            snippet_parts.append(f"Location: {location}")
-        snippet = " | ".join(snippet_parts) or "No details available"
-
-        return {
+        snippet = _join_snippet(
+            TYPE_LABEL + org_type if org_type else "",
+            LOCATION_LABEL + location if location else "",
+            "No details available",
+        )
+
+        formatted = {
             RESULT_ID: org_id,
             RESULT_TITLE: name,
             RESULT_SNIPPET: snippet,
             RESULT_URL: "",  # NCI doesn't provide direct URLs to organizations
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "type": org_type,
                 "city": city,
                 "state": state,
                 "country": result.get("country", ""),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of NCI organization results in order."""
+        return _format_batch(
+            NCIOrganizationHandler.format_result, results, include_metadata
+        )
 
 
 class NCIInterventionHandler:
     """Handles formatting for NCI intervention results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single NCI intervention result.
 
         Args:
             result: Raw intervention data from NCI CTS API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized intervention result with id, title, snippet, url, and metadata
         """
-        int_id = result.get("id", result.get("intervention_id", ""))
-        name = result.get("name", "Unknown Intervention")
-        int_type = result.get("type", result.get("category", ""))
+        int_id = _first_value(result, "id", "intervention_id")
+        name = result.get("name") or "Unknown Intervention"
+        int_type = _first_value(result, "type", "category")
         synonyms = result.get("synonyms", [])
 
         # Create snippet
-        snippet_parts = []
-        if int_type:
-            snippet_parts.append(f"Type: {int_type}")
-        if synonyms:
-            if isinstance(synonyms, list) and synonyms:
-                snippet_parts.append(
-                    f"Also known as: {', '.join(synonyms[:3])}"
-                )
-            elif isinstance(synonyms, str):
-                snippet_parts.append(f"Also known as: {synonyms}")
-        snippet = " | ".join(snippet_parts) or "No details available"
-
-        return {
+        snippet = _join_snippet(
+            TYPE_LABEL + int_type if int_type else "",
+            _synonyms_snippet(synonyms),
+            "No details available",
+        )
+
+        formatted = {
             RESULT_ID: int_id,
             RESULT_TITLE: name,
             RESULT_SNIPPET: snippet,
             RESULT_URL: "",  # NCI doesn't provide direct URLs to interventions
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "type": int_type,
                 "synonyms": synonyms,
                 "description": result.get("description", ""),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of NCI intervention results in order."""
+        return _format_batch(
+            NCIInterventionHandler.format_result, results, include_metadata
+        )
 
 
 class NCIBiomarkerHandler:
     """Handles formatting for NCI biomarker results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single NCI biomarker result.
 
         Args:
             result: Raw biomarker data from NCI CTS API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized biomarker result with id, title, snippet, url, and metadata
         """
-        bio_id = result.get("id", result.get("biomarker_id", ""))
-        name = result.get("name", "Unknown Biomarker")
-        gene = result.get("gene", result.get("gene_symbol", ""))
-        bio_type = result.get("type", result.get("category", ""))
+        bio_id = _first_value(result, "id", "biomarker_id")
+        name = result.get("name") or "Unknown Biomarker"
+        gene = _first_value(result, "gene", "gene_symbol")
+        bio_type = _first_value(result, "type", "category")
         assay_type = result.get("assay_type", "")
 
         # Build title
@@ -500,80 +764,92 @@ class NCIBiomarkerHandler:
             title = f"{gene} - {name}"
 
         # Create snippet
-        snippet_parts = []
-        if bio_type:
-            snippet_parts.append(f"Type: {bio_type}")
-        if assay_type:
-            snippet_parts.append(f"Assay: {assay_type}")
-        snippet = (
-            " | ".join(snippet_parts) or "Biomarker for trial eligibility"
+        snippet = _join_snippet(
+            TYPE_LABEL + bio_type if bio_type else "",
+            ASSAY_LABEL + assay_type if assay_type else "",
+            "Biomarker for trial eligibility",
         )
 
-        return {
+        formatted = {
             RESULT_ID: bio_id,
             RESULT_TITLE: title,
             RESULT_SNIPPET: snippet,
             RESULT_URL: "",  # NCI doesn't provide direct URLs to biomarkers
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "gene": gene,
                 "type": bio_type,
                 "assay_type": assay_type,
                 "trial_count": result.get("trial_count", 0),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of NCI biomarker results in order."""
+        return _format_batch(
+            NCIBiomarkerHandler.format_result, results, include_metadata
+        )
 
 
 class NCIDiseaseHandler:
     """Handles formatting for NCI disease vocabulary results."""
 
     @staticmethod
-    def format_result(result: dict[str, Any]) -> dict[str, Any]:
+    def format_result(
+        result: dict[str, Any], *, include_metadata: bool = True
+    ) -> dict[str, Any]:
         """Format a single NCI disease result.
 
         Args:
             result: Raw disease data from NCI CTS API
+            include_metadata: Whether to build the metadata sub-dict
 
         Returns:
             Standardized disease result with id, title, snippet, url, and metadata
         """
-        disease_id = result.get("id", result.get("disease_id", ""))
-        name = result.get(
-            "name", result.get("preferred_name", "Unknown Disease")
+        disease_id = _first_value(result, "id", "disease_id")
+        name = _first_value(
+            result, "name", "preferred_name", default="Unknown Disease"
         )
-        category = result.get("category", result.get("type", ""))
+        category = _first_value(result, "category", "type")
         synonyms = result.get("synonyms", [])
 
         # Create snippet
-        snippet_parts = []
-        if category:
-            snippet_parts.append(f"Category: {category}")
-        if synonyms:
-            if isinstance(synonyms, list) and synonyms:
-                snippet_parts.append(
-                    f"Also known as: {', '.join(synonyms[:3])}"
-                )
-                if len(synonyms) > 3:
-                    snippet_parts.append(f"and {len(synonyms) - 3} more")
-            elif isinstance(synonyms, str):
-                snippet_parts.append(f"Also known as: {synonyms}")
-        snippet = " | ".join(snippet_parts) or "NCI cancer vocabulary term"
-
-        return {
+        snippet = _join_snippet(
+            CATEGORY_LABEL + category if category else "",
+            _synonyms_snippet(synonyms, count_remaining=True),
+            "NCI cancer vocabulary term",
+        )
+
+        formatted = {
             RESULT_ID: disease_id,
             RESULT_TITLE: name,
             RESULT_SNIPPET: snippet,
             RESULT_URL: "",  # NCI doesn't provide direct URLs to disease terms
-            RESULT_METADATA: {
+        }
+        if include_metadata:
+            formatted[RESULT_METADATA] = {
                 "category": category,
                 "synonyms": synonyms,
                 "codes": result.get("codes", {}),
-            },
-        }
+            }
+        return formatted
+
+    @staticmethod
+    def format_results(
+        results: list[dict[str, Any]], *, include_metadata: bool = True
+    ) -> list[dict[str, Any]]:
+        """Format a batch of NCI disease results in order."""
+        return _format_batch(
+            NCIDiseaseHandler.format_result, results, include_metadata
+        )
 
 
-def get_domain_handler(
-    domain: str,
-) -> (
+HandlerClass = (
     type[ArticleHandler]
     | type[TrialHandler]
     | type[VariantHandler]
@@ -584,45 +860,38 @@ def get_domain_handler(
     | type[NCIInterventionHandler]
     | type[NCIBiomarkerHandler]
     | type[NCIDiseaseHandler]
-):
+)
+
+_DOMAIN_HANDLERS: dict[str, HandlerClass] = {
+    "article": ArticleHandler,
+    "trial": TrialHandler,
+    "variant": VariantHandler,
+    "gene": GeneHandler,
+    "drug": DrugHandler,
+    "disease": DiseaseHandler,
+    "nci_organization": NCIOrganizationHandler,
+    "nci_intervention": NCIInterventionHandler,
+    "nci_biomarker": NCIBiomarkerHandler,
+    "nci_disease": NCIDiseaseHandler,
+}
+
+
+@cache
+def get_domain_handler(domain: str) -> HandlerClass:
     """Get the appropriate handler class for a domain.
 
+    Lookups are memoized per domain; unknown domains raise and are not cached.
+
     Args:
         domain: The domain name ('article', 'trial', 'variant', 'gene', 'drug', 'disease',
                                'nci_organization', 'nci_intervention', 'nci_biomarker', 'nci_disease')
 
     Returns:
         The handler class for the domain
-
     Raises:
         ValueError: If domain is not recognized
     """
-    handlers: dict[
-        str,
-        type[ArticleHandler]
-        | type[TrialHandler]
-        | type[VariantHandler]
-        | type[GeneHandler]
-        | type[DrugHandler]
-        | type[DiseaseHandler]
-        | type[NCIOrganizationHandler]
-        | type[NCIInterventionHandler]
-        | type[NCIBiomarkerHandler]
-        | type[NCIDiseaseHandler],
-    ] = {
-        "article": ArticleHandler,
-        "trial": TrialHandler,
-        "variant": VariantHandler,
-        "gene": GeneHandler,
-        "drug": DrugHandler,
-        "disease": DiseaseHandler,
-        "nci_organization": NCIOrganizationHandler,
-        "nci_intervention": NCIInterventionHandler,
-        "nci_biomarker": NCIBiomarkerHandler,
-        "nci_disease": NCIDiseaseHandler,
-    }
-
-    handler = handlers.get(domain)
+    handler = _DOMAIN_HANDLERS.get(domain)
     if handler is None:
         raise ValueError(f"Unknown domain: {domain}")
 
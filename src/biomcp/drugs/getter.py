@@ -1,15 +1,20 @@
 """Drug information retrieval from MyChem.info."""
 
-import json
 import logging
 
+from ..constants import DETAILS_CACHE_MAX_SIZE, DETAILS_CACHE_TTL
 from ..integrations import BioThingsClient
+from ..utils.json_utils import dumps_pretty
+from ..utils.request_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Successful results only; errors and misses are always fetched again
+_drug_cache = get_cache("drug_details", max_size=DETAILS_CACHE_MAX_SIZE)
 
-def _add_drug_links(drug_info, result: dict) -> None:
-    """Add external database links for the drug."""
+
+def _drug_links(drug_info) -> dict[str, str]:
+    """Build external database links for the drug."""
     links = {}
 
     if drug_info.drugbank_id:
@@ -33,8 +38,7 @@ def _add_drug_links(drug_info, result: dict) -> None:
             f"https://www.ebi.ac.uk/chebi/searchId.do?chebiId=CHEBI:{chebi_id}"
         )
 
-    if links:
-        result["_links"] = links
+    return links
 
 
 def _format_basic_info(drug_info, output_lines: list[str]) -> None:
@@ -100,6 +104,27 @@ def _format_drug_output(drug_info, result: dict) -> None:
     result["_formatted"] = "\n".join(output_lines)
 
 
+def _render_drug(drug_info, links: dict[str, str], output_json: bool) -> str:
+    """Render drug information as formatted text or JSON."""
+    # Nothing to add: let pydantic-core serialize the model directly
+    if output_json and not links:
+        return drug_info.model_dump_json(exclude_none=True, indent=2)
+
+    # Build result dictionary
+    result = drug_info.model_dump(by_alias=False, exclude_none=True)
+
+    # Add external links
+    if links:
+        result["_links"] = links
+
+    if output_json:
+        return dumps_pretty(result)
+
+    # Format for text output
+    _format_drug_output(drug_info, result)
+    return result["_formatted"]
+
+
 async def get_drug(drug_id_or_name: str, output_json: bool = False) -> str:
     """Get drug information from MyChem.info.
 
@@ -110,6 +135,12 @@ async def get_drug(drug_id_or_name: str, output_json: bool = False) -> str:
     Returns:
         Formatted drug information or JSON string
     """
+    cache_key = f"{drug_id_or_name}:{output_json}"
+    cached = await _drug_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Drug details cache hit for {drug_id_or_name}")
+        return cached
+
     try:
         client = BioThingsClient()
         drug_info = await client.get_drug_info(drug_id_or_name)
@@ -117,29 +148,23 @@ async def get_drug(drug_id_or_name: str, output_json: bool = False) -> str:
         if not drug_info:
             error_msg = f"Drug '{drug_id_or_name}' not found in MyChem.info"
             if output_json:
-                return json.dumps({"error": error_msg}, indent=2)
+                return dumps_pretty({"error": error_msg})
             return error_msg
 
-        # Build result dictionary
-        result = drug_info.model_dump(by_alias=False, exclude_none=True)
+        links = _drug_links(drug_info)
 
-        # Add external links
-        _add_drug_links(drug_info, result)
-
-        if output_json:
-            return json.dumps(result, indent=2)
-
-        # Format for text output
-        _format_drug_output(drug_info, result)
-        return result["_formatted"]
+        output = _render_drug(drug_info, links, output_json)
 
     except Exception as e:
         logger.error(f"Error getting drug info: {e}")
         error_msg = f"Error retrieving drug information: {e!s}"
         if output_json:
-            return json.dumps({"error": error_msg}, indent=2)
+            return dumps_pretty({"error": error_msg})
         return error_msg
 
+    await _drug_cache.set(cache_key, output, DETAILS_CACHE_TTL)
+    return output
+
 
 # MCP tool function
 async def _drug_details(drug_id_or_name: str) -> str:
@@ -1,16 +1,49 @@
 """Gene information retrieval from MyGene.info."""
 
-import json
 import logging
 from typing import Annotated
 
 from pydantic import Field
 
+from ..constants import DETAILS_CACHE_MAX_SIZE, DETAILS_CACHE_TTL
 from ..integrations import BioThingsClient
 from ..render import to_markdown
+from ..utils.json_utils import dumps_pretty
+from ..utils.request_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Successful results only; errors and misses are always fetched again
+_gene_cache = get_cache("gene_details", max_size=DETAILS_CACHE_MAX_SIZE)
+
+
+def _render_gene(gene_info, output_json: bool) -> str:
+    """Render gene information as markdown or JSON."""
+    # Nothing to add: let pydantic-core serialize the model directly
+    if output_json and not (gene_info.entrezgene or gene_info.alias):
+        return gene_info.model_dump_json(exclude_none=True, indent=2)
+
+    # Convert to dict for rendering
+    result = gene_info.model_dump(exclude_none=True)
+
+    # Add helpful links
+    if gene_info.entrezgene:
+        result["_links"] = {
+            "NCBI Gene": f"https://www.ncbi.nlm.nih.gov/gene/{gene_info.entrezgene}",
+            "PubMed": f"https://pubmed.ncbi.nlm.nih.gov/?term={gene_info.symbol}",
+        }
+
+    # Format aliases nicely
+    if gene_info.alias:
+        result["alias"] = ", ".join(gene_info.alias[:10])  # Limit to first 10
+        if len(gene_info.alias) > 10:
+            result["alias"] += f" (and {len(gene_info.alias) - 10} more)"
+
+    if output_json:
+        return dumps_pretty(result)
+    else:
+        return to_markdown([result])
+
 
 async def get_gene(
     gene_id_or_symbol: str,
@@ -26,6 +59,12 @@ async def get_gene(
     Returns:
         Gene information as markdown or JSON string
     """
+    cache_key = f"{gene_id_or_symbol}:{output_json}"
+    cached = await _gene_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Gene details cache hit for {gene_id_or_symbol}")
+        return cached
+
     client = BioThingsClient()
 
     try:
@@ -37,33 +76,12 @@ async def get_gene(
                 "suggestion": "Please check the gene symbol or ID",
             }
             return (
-                json.dumps(error_data, indent=2)
+                dumps_pretty(error_data)
                 if output_json
                 else to_markdown([error_data])
             )
 
-        # Convert to dict for rendering
-        result = gene_info.model_dump(exclude_none=True)
-
-        # Add helpful links
-        if gene_info.entrezgene:
-            result["_links"] = {
-                "NCBI Gene": f"https://www.ncbi.nlm.nih.gov/gene/{gene_info.entrezgene}",
-                "PubMed": f"https://pubmed.ncbi.nlm.nih.gov/?term={gene_info.symbol}",
-            }
-
-        # Format aliases nicely
-        if gene_info.alias:
-            result["alias"] = ", ".join(
-                gene_info.alias[:10]
-            )  # Limit to first 10
-            if len(gene_info.alias) > 10:
-                result["alias"] += f" (and {len(gene_info.alias) - 10} more)"
-
-        if output_json:
-            return json.dumps(result, indent=2)
-        else:
-            return to_markdown([result])
+        output = _render_gene(gene_info, output_json)
 
     except Exception as e:
         logger.error(f"Error fetching gene info for {gene_id_or_symbol}: {e}")
@@ -72,11 +90,14 @@ async def get_gene(
             "details": str(e),
         }
         return (
-            json.dumps(error_data, indent=2)
+            dumps_pretty(error_data)
             if output_json
             else to_markdown([error_data])
         )
 
+    await _gene_cache.set(cache_key, output, DETAILS_CACHE_TTL)
+    return output
+
 
 async def _gene_details(
     call_benefit: Annotated[
@@ -1,17 +1,26 @@
+import asyncio
 import csv
+import functools
+import hashlib
 import json
+import logging
 import os
 import ssl
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from io import StringIO
 from ssl import PROTOCOL_TLS_CLIENT, SSLContext, TLSVersion
 from typing import Literal, TypeVar
 
 import certifi
-from diskcache import Cache
+from diskcache import FanoutCache
 from platformdirs import user_cache_dir
 from pydantic import BaseModel
 
-from .circuit_breaker import CircuitBreakerConfig, circuit_breaker
+from .circuit_breaker import CircuitBreakerConfig, get_circuit_breaker
+from .connection_pool import url_host
 from .constants import (
     AGGRESSIVE_INITIAL_RETRY_DELAY,
     AGGRESSIVE_MAX_RETRY_ATTEMPTS,
@@ -23,64 +32,253 @@ from .constants import (
 )
 from .http_client_simple import execute_http_request
 from .metrics import Timer
-from .rate_limiter import domain_limiter
+from .rate_limiter import domain_limiter, host_limiter
 from .retry import (
-    RetryableHTTPError,
     RetryConfig,
+    calculate_delay,
+    is_retryable_exception,
     is_retryable_status,
-    with_retry,
 )
 from .utils.endpoint_registry import get_registry
+from .utils.json_utils import dumps_canonical, loads
+
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
-class RequestError(BaseModel):
+# A plain slotted dataclass: one is built for every failed request, and
+# callers only read code/message, so pydantic validation buys nothing.
+@dataclass(slots=True)
+class RequestError:
     code: int
     message: str
 
 
-_cache: Cache | None = None
+# In-process LRU of raw responses in front of the disk cache (0 disables)
+MEMORY_CACHE_SIZE = int(os.environ.get("BIOMCP_HTTP_MEMORY_CACHE_SIZE", "512"))
+
+# cache_key -> (content, absolute expiry time or None)
+_memory_cache: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+
+# Disk cache writes are queued and run on one background thread, so
+# SQLite commits stay off the response path. Each pass writes everything
+# queued so far in one transaction, so a burst of responses (e.g. after a
+# gather) shares a commit. Past this backlog, the caller drains inline.
+CACHE_WRITE_BACKLOG = 256
+
+_cache_writer = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="biomcp-cache-writer"
+)
+_queued_cache_writes: deque[tuple[FanoutCache, str, object, int | None]] = (
+    deque()
+)
+_pending_cache_writes: set[Future] = set()
+
+
+# SQLite files the disk cache is sharded across, so concurrent writes to
+# different keys do not contend on a single database lock
+HTTP_CACHE_SHARDS = 8
+
 
+@functools.cache
+def get_cache() -> FanoutCache:
+    """Return the shared on-disk HTTP cache, opening it on first use.
+
+    Operations that cannot get a shard's lock within the timeout are
+    skipped (a get returns None) instead of blocking the request.
+    """
+    cache_path = os.path.join(user_cache_dir("biomcp"), "http_cache")
+    return FanoutCache(cache_path, shards=HTTP_CACHE_SHARDS, timeout=1.0)
 
-def get_cache() -> Cache:
-    global _cache
-    if _cache is None:
-        cache_path = os.path.join(user_cache_dir("biomcp"), "http_cache")
-        _cache = Cache(cache_path)
-    return _cache
+
+def _hash_key_source(key_source: bytes) -> str:
+    """Return a stable 128-bit hex digest of a cache key source."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(key_source)
+    return hashlib.blake2b(key_source, digest_size=16).hexdigest()
 
 
 def generate_cache_key(method: str, url: str, params: dict) -> str:
-    """Generate cache key using Python's built-in hash function for speed."""
+    """Generate a cache key that is stable across processes.
+
+    The built-in hash() is salted per interpreter (PYTHONHASHSEED), so keys
+    derived from it never match entries written to the disk cache by a
+    previous run. xxh3-128 is used when xxhash is installed, with BLAKE2b as
+    the standard-library fallback.
+    """
     # Handle simple cases without params
     if not params:
         return f"{method.upper()}:{url}"
 
-    # Use Python's built-in hash with a fixed seed for consistency
-    # This is much faster than SHA256 for cache keys
-    params_str = json.dumps(params, sort_keys=True, separators=(",", ":"))
-    key_source = f"{method.upper()}:{url}:{params_str}"
+    prefix = f"{method.upper()}:{url}:".encode()
+    return _hash_key_source(prefix + dumps_canonical(params))
+
+
+def _remember(cache_key: str, content: str, expire_at: float | None) -> None:
+    """Add a raw response to the in-process LRU."""
+    if MEMORY_CACHE_SIZE <= 0:
+        return
+    _memory_cache[cache_key] = (content, expire_at)
+    _memory_cache.move_to_end(cache_key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _recall(cache_key: str) -> str | None:
+    """Return a raw response from the in-process LRU if not expired."""
+    entry = _memory_cache.get(cache_key)
+    if entry is None:
+        return None
+    content, expire_at = entry
+    if expire_at is not None and time.time() >= expire_at:
+        del _memory_cache[cache_key]
+        return None
+    _memory_cache.move_to_end(cache_key)
+    return content
+
 
-    # Use Python's hash function with a fixed seed for deterministic results
-    # Convert to positive hex string for compatibility
-    hash_value = hash(key_source)
-    return f"{hash_value & 0xFFFFFFFFFFFFFFFF:016x}"
+def _drain_cache_writes() -> None:
+    """Write all queued entries, one transaction per cache."""
+    batches: dict[FanoutCache, list[tuple[str, object, int | None]]] = {}
+    while _queued_cache_writes:
+        cache, key, value, expire = _queued_cache_writes.popleft()
+        batches.setdefault(cache, []).append((key, value, expire))
+
+    for cache, writes in batches.items():
+        with cache.transact(retry=True):
+            for key, value, expire in writes:
+                cache.set(key, value, expire=expire)
+
+
+def _write_cache(
+    cache: FanoutCache, key: str, value: object, expire: int | None
+) -> None:
+    """Queue a disk cache write for the writer thread, inline if backlogged."""
+    backlogged = len(_queued_cache_writes) >= CACHE_WRITE_BACKLOG
+    _queued_cache_writes.append((cache, key, value, expire))
+    if backlogged:
+        _drain_cache_writes()
+        return
+    future = _cache_writer.submit(_drain_cache_writes)
+    _pending_cache_writes.add(future)
+    future.add_done_callback(_pending_cache_writes.discard)
+
+
+def flush_cache_writes() -> None:
+    """Block until all queued disk cache writes have completed."""
+    for future in list(_pending_cache_writes):
+        future.exception()
 
 
 def cache_response(cache_key: str, content: str, ttl: int):
     expire = None if ttl == -1 else ttl
-    cache = get_cache()
-    cache.set(cache_key, content, expire=expire)
+    # Memory is updated immediately; the disk copy is written behind
+    _remember(
+        cache_key, content, None if expire is None else time.time() + expire
+    )
+    _write_cache(get_cache(), cache_key, content, expire)
 
 
 def get_cached_response(cache_key: str) -> str | None:
+    content = _recall(cache_key)
+    if content is not None:
+        return content
     cache = get_cache()
     return cache.get(cache_key)
 
 
+# Bump when the stored form of parsed responses changes
+PARSED_CACHE_VERSION = 2
+
+
+def _parsed_cache_key(
+    cache_key: str, response_model_type: type[BaseModel]
+) -> str:
+    """Key for the parsed form of a response, per target model."""
+    model = response_model_type
+    return (
+        f"parsed:v{PARSED_CACHE_VERSION}:"
+        f"{model.__module__}.{model.__qualname__}:{cache_key}"
+    )
+
+
+def cache_parsed_response(
+    cache_key: str,
+    response_model_type: type[T],
+    parsed: T,
+    ttl: int,
+) -> None:
+    """Store the validated form of a response so cache hits parse less.
+
+    The model is dumped to JSON here, before the caller can mutate it,
+    and the text is written behind. It holds only the fields the model
+    kept, so it revalidates faster than the raw upstream body. Models
+    whose dump does not validate back to an equal object (e.g. because a
+    field is excluded from serialization) are not stored; hits on those
+    parse the raw entry instead.
+    """
+    content = parsed.model_dump_json(by_alias=True)
+    try:
+        if response_model_type.model_validate_json(content) != parsed:
+            return
+    except ValueError:
+        return
+    expire = None if ttl == -1 else ttl
+    _write_cache(
+        get_cache(),
+        _parsed_cache_key(cache_key, response_model_type),
+        content,
+        expire,
+    )
+
+
+def get_cached_result(
+    cache_key: str, response_model_type: type[T] | None
+) -> tuple[T | None, RequestError | None] | None:
+    """Return a cached result without touching the network.
+
+    Raw content held in memory is parsed directly, avoiding disk I/O.
+    Otherwise the validated form stored on disk is preferred, falling
+    back to parsing the raw disk entry. Returns None on a miss.
+    """
+    cached_content = _recall(cache_key)
+    if cached_content is None:
+        if response_model_type is not None:
+            stored = get_cache().get(
+                _parsed_cache_key(cache_key, response_model_type)
+            )
+            if isinstance(stored, str):
+                try:
+                    return response_model_type.model_validate_json(
+                        stored
+                    ), None
+                except ValueError:
+                    # Stored under an older model definition; use the raw entry
+                    pass
+        cached_content = get_cached_response(cache_key)
+
+    if cached_content:
+        return parse_response(200, cached_content, response_model_type)
+    return None
+
+
+@functools.cache
 def get_ssl_context(tls_version: TLSVersion) -> SSLContext:
-    """Create an SSLContext with the specified TLS version."""
+    """Return the shared SSLContext pinned to the specified TLS version.
+
+    Built once per version: loading the CA bundle is costly, and connection
+    pools are keyed by context identity, so a fresh context per request
+    would also defeat pooling.
+    """
     context = SSLContext(PROTOCOL_TLS_CLIENT)
     context.minimum_version = tls_version
     context.maximum_version = tls_version
@@ -88,6 +286,35 @@ def get_ssl_context(tls_version: TLSVersion) -> SSLContext:
     return context
 
 
+# Per-host circuit breakers share one static configuration
+_HTTP_BREAKER_CONFIG = CircuitBreakerConfig(
+    failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+    recovery_timeout=DEFAULT_RECOVERY_TIMEOUT,
+    success_threshold=DEFAULT_SUCCESS_THRESHOLD,
+    expected_exception=(ConnectionError, TimeoutError),
+)
+
+
+async def _execute_timed(
+    host: str,
+    method: str,
+    url: str,
+    params: dict,
+    verify: ssl.SSLContext | str | bool,
+    headers: dict[str, str] | None,
+) -> tuple[int, str]:
+    """Execute the request within host's concurrency limit.
+
+    Latency is recorded tagged by host and excludes the time spent
+    waiting for a slot, which is recorded as semaphore.wait_time.
+    """
+    async with (
+        host_limiter.limit(host),
+        Timer("http_request", tags={"method": method, "host": host}),
+    ):
+        return await execute_http_request(method, url, params, verify, headers)
+
+
 async def call_http(
     method: str,
     url: str,
@@ -98,6 +325,10 @@ async def call_http(
 ) -> tuple[int, str]:
     """Make HTTP request with optional retry logic.
 
+    Retries run in a plain loop over the request's outcome: retryable
+    exceptions and retryable status codes both back off and try again,
+    and the last attempt's status/text (or exception) is what callers see.
+
     Args:
         method: HTTP method (GET or POST)
         url: Target URL
@@ -108,52 +339,104 @@ async def call_http(
     Returns:
         Tuple of (status_code, response_text)
     """
+    host = url_host(url) or "unknown"
+    breaker = get_circuit_breaker(f"http_{host}", _HTTP_BREAKER_CONFIG)
 
-    async def _make_request() -> tuple[int, str]:
-        # Extract domain from URL for metrics tagging
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        host = parsed.hostname or "unknown"
+    if retry_config is None:
+        return await breaker.call(
+            _execute_timed, host, method, url, params, verify, headers
+        )
 
-        # Apply circuit breaker for the host
-        breaker_config = CircuitBreakerConfig(
-            failure_threshold=DEFAULT_FAILURE_THRESHOLD,
-            recovery_timeout=DEFAULT_RECOVERY_TIMEOUT,
-            success_threshold=DEFAULT_SUCCESS_THRESHOLD,
-            expected_exception=(ConnectionError, TimeoutError),
+    max_attempts = retry_config.max_attempts
+    for attempt in range(max_attempts):
+        final = attempt == max_attempts - 1
+        try:
+            status, text = await breaker.call(
+                _execute_timed, host, method, url, params, verify, headers
+            )
+        except Exception as exc:
+            if final or not is_retryable_exception(exc, retry_config):
+                raise
+            reason = str(exc)
+        else:
+            if final or not is_retryable_status(status, retry_config):
+                return status, text
+            reason = f"HTTP {status}"
+
+        delay = calculate_delay(attempt, retry_config)
+        logger.warning(
+            f"Retry attempt {attempt + 1}/{max_attempts} for {url} "
+            f"after {delay:.2f}s delay. Error: {reason}"
         )
+        await asyncio.sleep(delay)
 
-        @circuit_breaker(f"http_{host}", breaker_config)
-        async def _execute_with_breaker():
-            async with Timer(
-                "http_request", tags={"method": method, "host": host}
-            ):
-                return await execute_http_request(
-                    method, url, params, verify, headers
-                )
+    raise RuntimeError("Unexpected retry loop exit")
 
-        status, text = await _execute_with_breaker()
 
-        # Check if status code should trigger retry
-        if retry_config and is_retryable_status(status, retry_config):
-            raise RetryableHTTPError(status, text)
+# cache_key -> shared task for a request currently on the wire
+_inflight: dict[str, asyncio.Task[tuple[int, str]]] = {}
 
-        return status, text
 
-    # Apply retry logic if configured
-    if retry_config:
-        wrapped_func = with_retry(retry_config)(_make_request)
-        try:
-            return await wrapped_func()
-        except RetryableHTTPError as exc:
-            # Convert retryable HTTP errors back to status/text
-            return exc.status_code, exc.message
-        except Exception:
-            # Let other exceptions bubble up
-            raise
-    else:
-        return await _make_request()
+async def _call_http_limited(
+    domain: str | None,
+    method: str,
+    url: str,
+    params: dict,
+    verify: ssl.SSLContext | str | bool,
+    retry_config: RetryConfig | None,
+    headers: dict[str, str] | None,
+) -> tuple[int, str]:
+    """Make an HTTP call after taking a rate-limit token for the domain.
+
+    Only requests that reach the network consume tokens; cache hits and
+    offline responses never wait on the limiter.
+    """
+    if domain:
+        await domain_limiter.acquire(domain)
+    return await call_http(
+        method,
+        url,
+        params,
+        verify=verify,
+        retry_config=retry_config,
+        headers=headers,
+    )
+
+
+async def _call_http_coalesced(
+    cache_key: str,
+    domain: str | None,
+    method: str,
+    url: str,
+    params: dict,
+    verify: ssl.SSLContext | str | bool,
+    retry_config: RetryConfig | None,
+    headers: dict[str, str] | None,
+) -> tuple[int, str]:
+    """Make an HTTP call, sharing it with identical concurrent requests.
+
+    Callers that miss the cache while the same request is already in
+    flight await that request instead of issuing their own. Only the raw
+    (status, text) pair is shared; each caller parses it separately.
+    """
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(cache_key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(
+            _call_http_limited(
+                domain, method, url, params, verify, retry_config, headers
+            )
+        )
+        _inflight[cache_key] = task
+
+        def _forget(done: asyncio.Task[tuple[int, str]]) -> None:
+            if _inflight.get(cache_key) is done:
+                del _inflight[cache_key]
+
+        task.add_done_callback(_forget)
+
+    # Shield so one cancelled caller does not cancel the others' request
+    return await asyncio.shield(task)
 
 
 def _handle_offline_mode(
@@ -167,18 +450,14 @@ def _handle_offline_mode(
     if os.getenv("BIOMCP_OFFLINE", "").lower() not in ("true", "1", "yes"):
         return None
 
-    # In offline mode, only return cached responses
+    # In offline mode, only return cached responses. Build the key from the
+    # same params as the online path (e.g. without "_headers") so it matches.
     if cache_ttl > 0:
-        cache_key = generate_cache_key(
-            method,
-            url,
-            request
-            if isinstance(request, dict)
-            else request.model_dump(exclude_none=True, by_alias=True),
-        )
-        cached_content = get_cached_response(cache_key)
-        if cached_content:
-            return parse_response(200, cached_content, response_model_type)
+        params, _ = _prepare_request_params(request)
+        cache_key = generate_cache_key(method, url, params)
+        cached_result = get_cached_result(cache_key, response_model_type)
+        if cached_result is not None:
+            return cached_result
 
     return None, RequestError(
         code=503,
@@ -198,26 +477,49 @@ def _validate_endpoint(endpoint_key: str | None) -> None:
 
 def _prepare_request_params(
     request: BaseModel | dict,
+    headers: dict[str, str] | None = None,
 ) -> tuple[dict, dict | None]:
-    """Convert request to params dict and extract headers."""
+    """Convert request to params dict and extract headers.
+
+    Headers may also arrive in a legacy "_headers" entry of the request,
+    as a dict or a JSON string; explicit headers take precedence.
+    """
     if isinstance(request, BaseModel):
         params = request.model_dump(exclude_none=True, by_alias=True)
     else:
-        params = request.copy() if isinstance(request, dict) else request
+        # Nothing downstream mutates params, so dicts are not copied
+        params = request
 
-    # Extract headers if present
-    headers = None
     if isinstance(params, dict) and "_headers" in params:
-        try:
-            import json
-
-            headers = json.loads(params.pop("_headers"))
-        except (json.JSONDecodeError, TypeError):
-            pass  # Ignore invalid headers
+        legacy = params["_headers"]
+        params = {k: v for k, v in params.items() if k != "_headers"}
+        if not isinstance(legacy, dict):
+            try:
+                legacy = json.loads(legacy)
+            except (json.JSONDecodeError, TypeError):
+                legacy = None  # Ignore invalid headers
+        if isinstance(legacy, dict):
+            headers = {**legacy, **(headers or {})}
 
     return params, headers
 
 
+# Domains that get more aggressive retry settings
+_AGGRESSIVE_RETRY_DOMAINS = frozenset({
+    "clinicaltrials",
+    "pubmed",
+    "myvariant",
+})
+
+# Retry configs are never mutated, so one instance of each is shared
+_AGGRESSIVE_RETRY_CONFIG = RetryConfig(
+    max_attempts=AGGRESSIVE_MAX_RETRY_ATTEMPTS,
+    initial_delay=AGGRESSIVE_INITIAL_RETRY_DELAY,
+    max_delay=AGGRESSIVE_MAX_RETRY_DELAY,
+)
+_DEFAULT_RETRY_CONFIG = RetryConfig()
+
+
 def _get_retry_config(
     enable_retry: bool, domain: str | None
 ) -> RetryConfig | None:
@@ -225,14 +527,9 @@ def _get_retry_config(
     if not enable_retry:
         return None
 
-    # Use more aggressive retry for certain domains
-    if domain in ["clinicaltrials", "pubmed", "myvariant"]:
-        return RetryConfig(
-            max_attempts=AGGRESSIVE_MAX_RETRY_ATTEMPTS,
-            initial_delay=AGGRESSIVE_INITIAL_RETRY_DELAY,
-            max_delay=AGGRESSIVE_MAX_RETRY_DELAY,
-        )
-    return RetryConfig()  # Default settings
+    if domain in _AGGRESSIVE_RETRY_DOMAINS:
+        return _AGGRESSIVE_RETRY_CONFIG
+    return _DEFAULT_RETRY_CONFIG
 
 
 async def request_api(
@@ -245,6 +542,7 @@ async def request_api(
     domain: str | None = None,
     enable_retry: bool = True,
     endpoint_key: str | None = None,
+    headers: dict[str, str] | None = None,
 ) -> tuple[T | None, RequestError | None]:
     # Handle offline mode
     offline_result = _handle_offline_mode(
@@ -256,53 +554,47 @@ async def request_api(
     # Validate endpoint
     _validate_endpoint(endpoint_key)
 
-    # Apply rate limiting if domain is specified
-    if domain:
-        async with domain_limiter.limit(domain):
-            pass  # Rate limit acquired
-
     # Prepare request
     verify = get_ssl_context(tls_version) if tls_version else True
-    params, headers = _prepare_request_params(request)
+    params, headers = _prepare_request_params(request, headers)
     retry_config = _get_retry_config(enable_retry, domain)
 
     # Short-circuit if caching disabled
     if cache_ttl == 0:
-        status, content = await call_http(
-            method,
-            url,
-            params,
-            verify=verify,
-            retry_config=retry_config,
-            headers=headers,
+        status, content = await _call_http_limited(
+            domain, method, url, params, verify, retry_config, headers
         )
         return parse_response(status, content, response_model_type)
 
     # Handle caching
     cache_key = generate_cache_key(method, url, params)
-    cached_content = get_cached_response(cache_key)
+    cached_result = get_cached_result(cache_key, response_model_type)
 
-    if cached_content:
-        return parse_response(200, cached_content, response_model_type)
+    if cached_result is not None:
+        return cached_result
 
     # Make HTTP request if not cached
-    status, content = await call_http(
-        method,
-        url,
-        params,
-        verify=verify,
-        retry_config=retry_config,
-        headers=headers,
+    status, content = await _call_http_coalesced(
+        cache_key, domain, method, url, params, verify, retry_config, headers
     )
     parsed_response = parse_response(status, content, response_model_type)
 
     # Cache if successful response
     if status == 200:
         cache_response(cache_key, content, cache_ttl)
+        parsed, _ = parsed_response
+        if parsed is not None and response_model_type is not None:
+            cache_parsed_response(
+                cache_key, response_model_type, parsed, cache_ttl
+            )
 
     return parsed_response
 
 
+# CSV is detected from a comma in the header, so only the start is scanned
+CSV_SNIFF_LENGTH = 4096
+
+
 def parse_response(
     status_code: int,
     content: str,
@@ -311,8 +603,8 @@ def parse_response(
     if status_code != 200:
         return None, RequestError(code=status_code, message=content)
 
-    # Handle empty content
-    if not content or content.strip() == "":
+    # Handle empty content; isspace() stops at the first visible character
+    if not content or content.isspace():
         return None, RequestError(
             code=500,
             message="Empty response received from API",
@@ -321,9 +613,9 @@ def parse_response(
     try:
         if response_model_type is None:
             # Try to parse as JSON first
-            if content.startswith("{") or content.startswith("["):
-                response_dict = json.loads(content)
-            elif "," in content:
+            if content[0] in "{[":
+                response_dict = loads(content)
+            elif "," in content[:CSV_SNIFF_LENGTH]:
                 io = StringIO(content)
                 response_dict = list(csv.DictReader(io))
             else:
@@ -1,33 +1,35 @@
 """Helper functions for simpler HTTP client operations."""
 
 import asyncio
-import contextlib
-import json
 import os
 import ssl
 
 import httpx
 
+from .connection_pool import resolve_verify
+from .utils.json_utils import dumps
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 # Global connection pools per SSL context
 _connection_pools: dict[str, httpx.AsyncClient] = {}
 _pool_lock = asyncio.Lock()
 
 
-def close_all_pools():
+async def close_all_pools():
     """Close all connection pools. Useful for cleanup in tests."""
-    global _connection_pools
-    for pool in _connection_pools.values():
-        if pool and not pool.is_closed:
-            # Schedule the close in a safe way
-            try:
-                # Store task reference to avoid garbage collection
-                close_task = asyncio.create_task(pool.aclose())
-                # Optionally add a callback to handle completion
-                close_task.add_done_callback(lambda t: None)
-            except RuntimeError:
-                # If no event loop is running, close synchronously
-                pool._transport.close()
+    pools = [pool for pool in _connection_pools.values() if not pool.is_closed]
     _connection_pools.clear()
+    if pools:
+        # Await every close so none is left pending when the loop stops
+        await asyncio.gather(
+            *(pool.aclose() for pool in pools), return_exceptions=True
+        )
 
 
 async def get_connection_pool(
@@ -43,12 +45,17 @@ async def get_connection_pool(
     else:
         pool_key = str(verify)
 
+    # Fast path: only take the lock when a pool must be created
+    pool = _connection_pools.get(pool_key)
+    if pool is not None and not pool.is_closed:
+        return pool
+
     async with _pool_lock:
         pool = _connection_pools.get(pool_key)
         if pool is None or pool.is_closed:
             # Create a new connection pool with optimized settings
             pool = httpx.AsyncClient(
-                verify=verify,
+                verify=resolve_verify(verify),
                 http2=False,  # HTTP/2 can add overhead for simple requests
                 timeout=timeout,
                 limits=httpx.Limits(
@@ -65,6 +72,78 @@ async def get_connection_pool(
         return pool
 
 
+def use_aiohttp_backend() -> bool:
+    """Whether requests should go through the optional aiohttp backend.
+
+    Opt in with BIOMCP_HTTP_BACKEND=aiohttp; httpx is used otherwise and
+    whenever aiohttp is not installed.
+    """
+    backend = os.getenv("BIOMCP_HTTP_BACKEND", "httpx").lower()
+    return backend == "aiohttp" and AIOHTTP_AVAILABLE
+
+
+def _query_items(params: dict) -> list[tuple[str, str]]:
+    """Encode query params the way httpx does for aiohttp.
+
+    aiohttp only accepts str/int/float values, so booleans, None and
+    list values are converted explicitly.
+    """
+    items = []
+    for key, value in params.items():
+        values = value if isinstance(value, list | tuple) else [value]
+        for item in values:
+            if item is True:
+                item = "true"
+            elif item is False:
+                item = "false"
+            elif item is None:
+                item = ""
+            items.append((key, str(item)))
+    return items
+
+
+async def _execute_aiohttp_request(
+    method: str,
+    url: str,
+    params: dict,
+    verify: ssl.SSLContext | str | bool,
+    headers: dict[str, str],
+) -> tuple[int, str]:
+    """Execute the request on a pooled aiohttp session.
+
+    Mirrors the httpx path in execute_http_request, including its
+    exception mapping.
+    """
+    from .connection_pool import get_aiohttp_session
+    from .constants import HTTP_ERROR_CODE_NETWORK, HTTP_TIMEOUT_SECONDS
+
+    session = get_aiohttp_session(verify)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+
+    try:
+        if method.upper() == "GET":
+            request = session.get(
+                url,
+                params=_query_items(params),
+                headers=headers,
+                timeout=timeout,
+            )
+        else:
+            request = session.post(
+                url, data=dumps(params), headers=headers, timeout=timeout
+            )
+        async with request as resp:
+            text = await resp.text()
+            return resp.status, text or "{}"
+    except aiohttp.ClientConnectorError as exc:
+        raise ConnectionError(f"Failed to connect to {url}: {exc}") from exc
+    except asyncio.TimeoutError as exc:
+        raise TimeoutError(f"Request to {url} timed out: {exc}") from exc
+    except aiohttp.ClientError as exc:
+        error_msg = str(exc) if str(exc) else "Network connectivity error"
+        return HTTP_ERROR_CODE_NETWORK, error_msg
+
+
 async def execute_http_request(  # noqa: C901
     method: str,
     url: str,
@@ -91,11 +170,27 @@ async def execute_http_request(  # noqa: C901
     from .constants import HTTP_TIMEOUT_SECONDS
 
     try:
-        # Extract custom headers from params if present
-        custom_headers = headers or {}
-        if "_headers" in params:
-            with contextlib.suppress(json.JSONDecodeError, TypeError):
-                custom_headers.update(json.loads(params.pop("_headers")))
+        # Copy so defaults added below never leak into the caller's dict
+        custom_headers = dict(headers) if headers else {}
+
+        if method.upper() not in ("GET", "POST"):
+            from .constants import HTTP_ERROR_CODE_UNSUPPORTED_METHOD
+
+            return (
+                HTTP_ERROR_CODE_UNSUPPORTED_METHOD,
+                f"Unsupported method {method}",
+            )
+
+        # Encode POST bodies ourselves; httpx's json= uses stdlib json
+        if method.upper() == "POST" and not any(
+            k.lower() == "content-type" for k in custom_headers
+        ):
+            custom_headers["Content-Type"] = "application/json"
+
+        if use_aiohttp_backend():
+            return await _execute_aiohttp_request(
+                method, url, params, verify, custom_headers
+            )
 
         # Use the configured timeout from constants
         timeout = httpx.Timeout(HTTP_TIMEOUT_SECONDS)
@@ -108,39 +203,38 @@ async def execute_http_request(  # noqa: C901
         if use_pool:
             try:
                 # Use the new connection pool manager
-                from ..connection_pool import get_connection_pool as get_pool
+                from .connection_pool import get_connection_pool as get_pool
+                from .connection_pool import http2_host
 
-                client = await get_pool(verify, timeout)
+                client = await get_pool(verify, timeout, http2_host(url))
                 should_close = False
             except Exception:
                 # Fallback to creating a new client
                 client = httpx.AsyncClient(
-                    verify=verify, http2=False, timeout=timeout
+                    verify=resolve_verify(verify), http2=False, timeout=timeout
                 )
                 should_close = True
         else:
             # Create a new client for each request
             client = httpx.AsyncClient(
-                verify=verify, http2=False, timeout=timeout
+                verify=resolve_verify(verify), http2=False, timeout=timeout
             )
             should_close = True
 
         try:
             # Make the request
             if method.upper() == "GET":
+                # Pass the timeout per request: pooled clients are shared
+                # by callers whose timeout may differ from the pool's
                 resp = await client.get(
-                    url, params=params, headers=custom_headers
-                )
-            elif method.upper() == "POST":
-                resp = await client.post(
-                    url, json=params, headers=custom_headers
+                    url, params=params, headers=custom_headers, timeout=timeout
                 )
             else:
-                from .constants import HTTP_ERROR_CODE_UNSUPPORTED_METHOD
-
-                return (
-                    HTTP_ERROR_CODE_UNSUPPORTED_METHOD,
-                    f"Unsupported method {method}",
+                resp = await client.post(
+                    url,
+                    content=dumps(params),
+                    headers=custom_headers,
+                    timeout=timeout,
                 )
 
             # Check for empty response
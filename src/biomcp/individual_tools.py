@@ -4,6 +4,7 @@ This module provides the original 9 individual tools that offer direct access
 to specific search and fetch functionality, complementing the unified tools.
 """
 
+import asyncio
 import logging
 from typing import Annotated, Literal
 
@@ -28,10 +29,94 @@ from biomcp.trials.getter import (
 )
 from biomcp.trials.search import _trial_searcher
 from biomcp.variants.getter import _variant_details
-from biomcp.variants.search import _variant_searcher
+from biomcp.variants.search import (
+    ClinicalSignificance,
+    PolyPhenPrediction,
+    SiftPrediction,
+    _variant_searcher,
+)
 
 logger = logging.getLogger(__name__)
 
+# variant_searcher filter values -> MyVariant.info query values
+_SIGNIFICANCE_VALUES = {
+    "pathogenic": ClinicalSignificance.PATHOGENIC,
+    "likely_pathogenic": ClinicalSignificance.LIKELY_PATHOGENIC,
+    "uncertain_significance": ClinicalSignificance.UNCERTAIN_SIGNIFICANCE,
+    "likely_benign": ClinicalSignificance.LIKELY_BENIGN,
+    "benign": ClinicalSignificance.BENIGN,
+    "conflicting": ClinicalSignificance.CONFLICTING,
+}
+_SIFT_VALUES = {
+    "deleterious": SiftPrediction.DELETERIOUS,
+    "tolerated": SiftPrediction.TOLERATED,
+}
+_POLYPHEN_VALUES = {
+    "probably_damaging": PolyPhenPrediction.PROBABLY_DAMAGING,
+    "possibly_damaging": PolyPhenPrediction.POSSIBLY_DAMAGING,
+    "benign": PolyPhenPrediction.BENIGN,
+}
+
+
+# Returned when an NCI search trips the Elasticsearch bucket limit
+_ORGANIZATION_SEARCH_TOO_BROAD = (
+    "⚠️ **Search Too Broad**\n\n"
+    "The NCI API cannot process this search because it returns too many results.\n\n"
+    "**To fix this, try:**\n"
+    "1. **Always use city AND state together** for location searches\n"
+    "2. Add an organization name (even partial) to narrow results\n"
+    "3. Use multiple filters together (name + location, or name + type)\n\n"
+    "**Examples that work:**\n"
+    "- `nci_organization_searcher(city='Cleveland', state='OH')`\n"
+    "- `nci_organization_searcher(name='Cleveland Clinic')`\n"
+    "- `nci_organization_searcher(name='cancer', city='Boston', state='MA')`\n"
+    "- `nci_organization_searcher(organization_type='Academic', city='Houston', state='TX')`"
+)
+
+_INTERVENTION_SEARCH_TOO_BROAD = (
+    "⚠️ **Search Too Broad**\n\n"
+    "The NCI API cannot process this search because it returns too many results.\n\n"
+    "**Try adding more specific filters:**\n"
+    "- Add an intervention name (even partial)\n"
+    "- Specify an intervention type (e.g., 'Drug', 'Device')\n"
+    "- Search for a specific drug or therapy name\n\n"
+    "**Example searches that work better:**\n"
+    "- Search for 'pembrolizumab' instead of all drugs\n"
+    "- Search for 'CAR-T' to find CAR-T cell therapies\n"
+    "- Filter by type: Drug, Device, Procedure, etc."
+)
+
+_BIOMARKER_SEARCH_TOO_BROAD = (
+    "⚠️ **Search Too Broad**\n\n"
+    "The NCI API cannot process this search because it returns too many results.\n\n"
+    "**Try adding more specific filters:**\n"
+    "- Add a biomarker name (even partial)\n"
+    "- Specify a gene symbol\n"
+    "- Add an assay type (e.g., 'IHC', 'NGS')\n\n"
+    "**Example searches that work:**\n"
+    "- `nci_biomarker_searcher(name='PD-L1')`\n"
+    "- `nci_biomarker_searcher(gene='EGFR', biomarker_type='mutation')`\n"
+    "- `nci_biomarker_searcher(assay_type='IHC')`"
+)
+
+_DISEASE_SEARCH_TOO_BROAD = (
+    "⚠️ **Search Too Broad**\n\n"
+    "The NCI API cannot process this search because it returns too many results.\n\n"
+    "**Try adding more specific filters:**\n"
+    "- Add a disease name (even partial)\n"
+    "- Specify a disease category\n"
+    "- Use more specific search terms\n\n"
+    "**Example searches that work:**\n"
+    "- `nci_disease_searcher(name='melanoma')`\n"
+    "- `nci_disease_searcher(name='lung', category='maintype')`\n"
+    "- `nci_disease_searcher(name='NSCLC')`"
+)
+
+
+def _is_search_too_broad(error_msg: str) -> bool:
+    """Whether a CTS API error is the Elasticsearch bucket limit."""
+    return "too_many_buckets_exception" in error_msg or "75000" in error_msg
+
 
 # Article Tools
 @mcp_app.tool()
@@ -100,7 +185,11 @@ async def article_searcher(
     keywords = ensure_list(keywords) if keywords else None
     variants = ensure_list(variants) if variants else None
 
-    result = await _article_searcher(
+    # Nothing to search for; don't send an unfiltered query upstream
+    if not any((chemicals, diseases, genes, keywords, variants)):
+        return "No search criteria provided."
+
+    search = _article_searcher(
         call_benefit="Direct article search for specific biomedical topics",
         chemicals=chemicals,
         diseases=diseases,
@@ -111,7 +200,8 @@ async def article_searcher(
         include_cbioportal=include_cbioportal,
     )
 
-    # Add cBioPortal summary if searching by gene
+    # Add cBioPortal summary if searching by gene, fetched alongside the
+    # search (the helper logs and returns None on failure)
     if include_cbioportal and genes:
         request_params = {
             "keywords": keywords,
@@ -119,13 +209,14 @@ async def article_searcher(
             "chemicals": chemicals,
             "variants": variants,
         }
-        cbioportal_summary = await get_cbioportal_summary_for_genes(
-            genes, request_params
+        result, cbioportal_summary = await asyncio.gather(
+            search, get_cbioportal_summary_for_genes(genes, request_params)
         )
         if cbioportal_summary:
             result = cbioportal_summary + "\n\n---\n\n" + result
+        return result
 
-    return result
+    return await search
 
 
 @mcp_app.tool()
@@ -245,6 +336,12 @@ async def trial_searcher(
         int,
         Field(description="Results per page", ge=1, le=100),
     ] = 10,
+    next_page_hash: Annotated[
+        str | None,
+        Field(
+            description="Next Page Token from a previous search, to fetch the following page"
+        ),
+    ] = None,
 ) -> str:
     """Search ClinicalTrials.gov for clinical studies.
 
@@ -258,6 +355,9 @@ async def trial_searcher(
     - For city-based searches, AI agents should geocode to lat/long first
     - Distance parameter only works with lat/long coordinates
 
+    Pagination: pass the "Next Page Token" shown in the results as
+    next_page_hash to continue from where the previous page ended.
+
     Returns a formatted list of matching trials with key details.
     """
     # Validate location parameters
@@ -296,6 +396,7 @@ async def trial_searcher(
         age_group=age_group,
         study_type=study_type,
         page_size=page_size,
+        next_page_hash=next_page_hash,
     )
 
 
@@ -318,36 +419,22 @@ async def trial_getter(
     - trial_outcomes_getter: Primary/secondary outcomes and results
     - trial_references_getter: Publications and references
     """
-    results = []
-
-    # Get all sections
-    protocol = await _trial_protocol(
-        call_benefit="Fetch comprehensive trial details for analysis",
-        nct_id=nct_id,
-    )
-    if protocol:
-        results.append(protocol)
-
-    locations = await _trial_locations(
-        call_benefit="Fetch comprehensive trial details for analysis",
-        nct_id=nct_id,
-    )
-    if locations:
-        results.append(locations)
-
-    outcomes = await _trial_outcomes(
-        call_benefit="Fetch comprehensive trial details for analysis",
-        nct_id=nct_id,
+    # The sections are independent requests, so fetch them concurrently
+    call_benefit = "Fetch comprehensive trial details for analysis"
+    sections = await asyncio.gather(
+        _trial_protocol(call_benefit=call_benefit, nct_id=nct_id),
+        _trial_locations(call_benefit=call_benefit, nct_id=nct_id),
+        _trial_outcomes(call_benefit=call_benefit, nct_id=nct_id),
+        _trial_references(call_benefit=call_benefit, nct_id=nct_id),
+        return_exceptions=True,
     )
-    if outcomes:
-        results.append(outcomes)
 
-    references = await _trial_references(
-        call_benefit="Fetch comprehensive trial details for analysis",
-        nct_id=nct_id,
-    )
-    if references:
-        results.append(references)
+    results = []
+    for section in sections:
+        if isinstance(section, BaseException):
+            logger.warning(f"Failed to fetch a section of {nct_id}: {section}")
+        elif section:
+            results.append(section)
 
     return (
         "\n\n".join(results)
@@ -545,30 +632,60 @@ async def variant_searcher(
 
     Search by various identifiers or filter by clinical/functional criteria.
     """
-    result = await _variant_searcher(
+    # Nothing to search for; don't send an unfiltered query upstream.
+    # Numeric filters count even when 0.
+    criteria = (
+        gene,
+        hgvs,
+        hgvsp,
+        hgvsc,
+        rsid,
+        region,
+        significance,
+        frequency_min,
+        frequency_max,
+        consequence,
+        cadd_score_min,
+        sift_prediction,
+        polyphen_prediction,
+    )
+    if all(value is None or value == "" for value in criteria):
+        return "No search criteria provided."
+
+    search = _variant_searcher(
         call_benefit="Direct variant database search for genetic analysis",
         gene=gene,
         hgvsp=hgvsp,
         hgvsc=hgvsc,
         rsid=rsid,
         region=region,
-        significance=significance,
+        significance=(
+            _SIGNIFICANCE_VALUES[significance] if significance else None
+        ),
         min_frequency=frequency_min,
         max_frequency=frequency_max,
         cadd=cadd_score_min,
-        sift=sift_prediction,
-        polyphen=polyphen_prediction,
+        sift=_SIFT_VALUES[sift_prediction] if sift_prediction else None,
+        polyphen=(
+            _POLYPHEN_VALUES[polyphen_prediction]
+            if polyphen_prediction
+            else None
+        ),
         size=page_size,
         offset=(page - 1) * page_size if page > 1 else 0,
     )
 
-    # Add cBioPortal summary if searching by gene
+    # Add cBioPortal summary if searching by gene, fetched alongside the
+    # search (the helper logs and returns None on failure)
     if include_cbioportal and gene:
-        cbioportal_summary = await get_variant_cbioportal_summary(gene)
+        result, cbioportal_summary = await asyncio.gather(
+            search, get_variant_cbioportal_summary(gene)
+        )
         if cbioportal_summary:
             result = cbioportal_summary + "\n\n" + result
+        return result
 
-    return result
+    return await search
 
 
 @mcp_app.tool()
@@ -895,20 +1012,8 @@ async def nci_organization_searcher(
     except CTSAPIError as e:
         # Check for Elasticsearch bucket limit error
         error_msg = str(e)
-        if "too_many_buckets_exception" in error_msg or "75000" in error_msg:
-            return (
-                "⚠️ **Search Too Broad**\n\n"
-                "The NCI API cannot process this search because it returns too many results.\n\n"
-                "**To fix this, try:**\n"
-                "1. **Always use city AND state together** for location searches\n"
-                "2. Add an organization name (even partial) to narrow results\n"
-                "3. Use multiple filters together (name + location, or name + type)\n\n"
-                "**Examples that work:**\n"
-                "- `nci_organization_searcher(city='Cleveland', state='OH')`\n"
-                "- `nci_organization_searcher(name='Cleveland Clinic')`\n"
-                "- `nci_organization_searcher(name='cancer', city='Boston', state='MA')`\n"
-                "- `nci_organization_searcher(organization_type='Academic', city='Houston', state='TX')`"
-            )
+        if _is_search_too_broad(error_msg):
+            return _ORGANIZATION_SEARCH_TOO_BROAD
         raise
 
 
@@ -1027,19 +1132,8 @@ async def nci_intervention_searcher(
     except CTSAPIError as e:
         # Check for Elasticsearch bucket limit error
         error_msg = str(e)
-        if "too_many_buckets_exception" in error_msg or "75000" in error_msg:
-            return (
-                "⚠️ **Search Too Broad**\n\n"
-                "The NCI API cannot process this search because it returns too many results.\n\n"
-                "**Try adding more specific filters:**\n"
-                "- Add an intervention name (even partial)\n"
-                "- Specify an intervention type (e.g., 'Drug', 'Device')\n"
-                "- Search for a specific drug or therapy name\n\n"
-                "**Example searches that work better:**\n"
-                "- Search for 'pembrolizumab' instead of all drugs\n"
-                "- Search for 'CAR-T' to find CAR-T cell therapies\n"
-                "- Filter by type: Drug, Device, Procedure, etc."
-            )
+        if _is_search_too_broad(error_msg):
+            return _INTERVENTION_SEARCH_TOO_BROAD
         raise
 
 
@@ -1153,19 +1247,8 @@ async def nci_biomarker_searcher(
     except CTSAPIError as e:
         # Check for Elasticsearch bucket limit error
         error_msg = str(e)
-        if "too_many_buckets_exception" in error_msg or "75000" in error_msg:
-            return (
-                "⚠️ **Search Too Broad**\n\n"
-                "The NCI API cannot process this search because it returns too many results.\n\n"
-                "**Try adding more specific filters:**\n"
-                "- Add a biomarker name (even partial)\n"
-                "- Specify a gene symbol\n"
-                "- Add an assay type (e.g., 'IHC', 'NGS')\n\n"
-                "**Example searches that work:**\n"
-                "- `nci_biomarker_searcher(name='PD-L1')`\n"
-                "- `nci_biomarker_searcher(gene='EGFR', biomarker_type='mutation')`\n"
-                "- `nci_biomarker_searcher(assay_type='IHC')`"
-            )
+        if _is_search_too_broad(error_msg):
+            return _BIOMARKER_SEARCH_TOO_BROAD
         raise
 
 
@@ -1240,19 +1323,8 @@ async def nci_disease_searcher(
     except CTSAPIError as e:
         # Check for Elasticsearch bucket limit error
         error_msg = str(e)
-        if "too_many_buckets_exception" in error_msg or "75000" in error_msg:
-            return (
-                "⚠️ **Search Too Broad**\n\n"
-                "The NCI API cannot process this search because it returns too many results.\n\n"
-                "**Try adding more specific filters:**\n"
-                "- Add a disease name (even partial)\n"
-                "- Specify a disease category\n"
-                "- Use more specific search terms\n\n"
-                "**Example searches that work:**\n"
-                "- `nci_disease_searcher(name='melanoma')`\n"
-                "- `nci_disease_searcher(name='lung', category='maintype')`\n"
-                "- `nci_disease_searcher(name='NSCLC')`"
-            )
+        if _is_search_too_broad(error_msg):
+            return _DISEASE_SEARCH_TOO_BROAD
         raise
 
 
@@ -1546,7 +1618,9 @@ async def openfda_approval_searcher(
     ] = None,
     approval_year: Annotated[
         str | None,
-        Field(description="Year of approval (YYYY format)"),
+        Field(
+            description="Year of approval (YYYY format)", pattern=r"^\d{4}$"
+        ),
     ] = None,
     limit: Annotated[
         int,
@@ -1640,7 +1714,10 @@ async def openfda_recall_searcher(
     ] = None,
     since_date: Annotated[
         str | None,
-        Field(description="Show recalls after this date (YYYYMMDD format)"),
+        Field(
+            description="Show recalls after this date (YYYYMMDD format)",
+            pattern=r"^\d{8}$",
+        ),
     ] = None,
     limit: Annotated[
         int,
@@ -1,6 +1,5 @@
 """NCI Clinical Trials Search API integration helper."""
 
-import json
 import logging
 import os
 from typing import Any, Literal
@@ -33,11 +32,20 @@ def _validate_api_key(api_key: str | None) -> str:
     return api_key
 
 
+def uses_server_api_key(api_key: str | None) -> bool:
+    """Whether a request made with api_key authenticates as the server.
+
+    Only such lookups may share cached results; a caller-supplied key
+    always reaches the API, so a cached entry never stands in for that
+    key being accepted.
+    """
+    return not api_key or api_key == os.getenv(NCI_API_KEY_ENV)
+
+
 def _prepare_request_data(
     method: str,
     params: dict[str, Any] | None,
     json_data: dict[str, Any] | None,
-    headers: dict[str, str],
 ) -> dict[str, Any]:
     """Prepare request data based on method."""
     if method == "GET":
@@ -48,10 +56,6 @@ def _prepare_request_data(
         if method == "POST":
             logger.debug(f"CTS API POST request with data: {json_data}")
 
-    # Add headers to request data
-    if headers:
-        request_data["_headers"] = json.dumps(headers)
-
     return request_data
 
 
@@ -102,9 +106,7 @@ async def make_cts_request(
 
     try:
         # Prepare request data
-        request_data = _prepare_request_data(
-            method, params, json_data, headers
-        )
+        request_data = _prepare_request_data(method, params, json_data)
 
         # Make API request
         response, error = await request_api(
@@ -112,6 +114,7 @@ async def make_cts_request(
             request=request_data,
             method=method,
             cache_ttl=0,  # Disable caching for NCI API to ensure fresh results
+            headers=headers,
         )
 
         # Handle errors
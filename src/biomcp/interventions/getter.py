@@ -1,13 +1,27 @@
 """Get specific intervention details via NCI CTS API."""
 
+import copy
 import logging
 from typing import Any
 
-from ..constants import NCI_INTERVENTIONS_URL
-from ..integrations.cts_api import CTSAPIError, make_cts_request
+from ..constants import (
+    DETAILS_CACHE_MAX_SIZE,
+    DETAILS_CACHE_TTL,
+    NCI_INTERVENTIONS_URL,
+)
+from ..integrations.cts_api import (
+    CTSAPIError,
+    make_cts_request,
+    uses_server_api_key,
+)
+from ..utils.request_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+_intervention_cache = get_cache(
+    "intervention_details", max_size=DETAILS_CACHE_MAX_SIZE
+)
+
 
 async def get_intervention(
     intervention_id: str,
@@ -26,6 +40,14 @@ async def get_intervention(
     Raises:
         CTSAPIError: If the API request fails or intervention not found
     """
+    if uses_server_api_key(api_key):
+        cached = await _intervention_cache.get(intervention_id)
+        if cached is not None:
+            logger.debug(
+                f"Returning cached intervention details for {intervention_id}"
+            )
+            return copy.deepcopy(cached)
+
     try:
         # Make API request
         url = f"{NCI_INTERVENTIONS_URL}/{intervention_id}"
@@ -36,11 +58,17 @@ async def get_intervention(
 
         # Return the intervention data
         if "data" in response:
-            return response["data"]
+            result = response["data"]
         elif "intervention" in response:
-            return response["intervention"]
+            result = response["intervention"]
         else:
-            return response
+            result = response
+
+        if uses_server_api_key(api_key):
+            await _intervention_cache.set(
+                intervention_id, copy.deepcopy(result), DETAILS_CACHE_TTL
+            )
+        return result
 
     except CTSAPIError:
         raise
@@ -14,6 +14,9 @@ from .constants import (
     METRIC_PERCENTILE_50,
     METRIC_PERCENTILE_95,
     METRIC_PERCENTILE_99,
+    METRIC_SLOW_CALL_FACTOR,
+    METRIC_SLOW_CALL_MIN_SAMPLES,
+    METRIC_SLOW_CALL_REFRESH,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,18 @@ METRICS_ENABLED = (
 )
 
 
+def _percentile(data: list[float], p: float) -> float:
+    """Calculate a percentile of sorted data."""
+    if not data:
+        return 0.0
+    k = (len(data) - 1) * p
+    f = int(k)
+    c = k - f
+    if f >= len(data) - 1:
+        return data[-1]
+    return data[f] + c * (data[f + 1] - data[f])
+
+
 @dataclass
 class MetricSample:
     """Single metric measurement."""
@@ -77,17 +92,6 @@ class MetricSummary:
         success_count = sum(1 for s in samples if s.success)
         error_count = len(samples) - success_count
 
-        def percentile(data: list[float], p: float) -> float:
-            """Calculate percentile."""
-            if not data:
-                return 0.0
-            k = (len(data) - 1) * p
-            f = int(k)
-            c = k - f
-            if f >= len(data) - 1:
-                return data[-1]
-            return data[f] + c * (data[f + 1] - data[f])
-
         return cls(
             name=name,
             count=len(samples),
@@ -97,15 +101,20 @@ class MetricSummary:
             min_duration=min(durations),
             max_duration=max(durations),
             avg_duration=sum(durations) / len(durations),
-            p50_duration=percentile(durations, METRIC_PERCENTILE_50),
-            p95_duration=percentile(durations, METRIC_PERCENTILE_95),
-            p99_duration=percentile(durations, METRIC_PERCENTILE_99),
+            p50_duration=_percentile(durations, METRIC_PERCENTILE_50),
+            p95_duration=_percentile(durations, METRIC_PERCENTILE_95),
+            p99_duration=_percentile(durations, METRIC_PERCENTILE_99),
             error_rate=error_count / len(samples) if samples else 0.0,
         )
 
 
 class MetricsCollector:
-    """Collects and manages performance metrics."""
+    """Collects and manages performance metrics.
+
+    A sample slower than METRIC_SLOW_CALL_FACTOR times its metric's P95 is
+    logged as a slow call. The P95 is recomputed every
+    METRIC_SLOW_CALL_REFRESH samples rather than on every record.
+    """
 
     def __init__(self, max_samples_per_metric: int = MAX_METRIC_SAMPLES):
         """Initialize metrics collector.
@@ -116,6 +125,8 @@ class MetricsCollector:
         self._metrics: dict[str, list[MetricSample]] = defaultdict(list)
         self._max_samples = max_samples_per_metric
         self._lock = asyncio.Lock()
+        # name -> (samples recorded since the P95 was computed, P95)
+        self._p95: dict[str, tuple[int, float]] = {}
 
     async def record(
         self,
@@ -144,11 +155,39 @@ class MetricsCollector:
 
         async with self._lock:
             samples = self._metrics[name]
+            self._check_slow_call(name, sample)
             samples.append(sample)
 
             # Keep only the most recent samples
             if len(samples) > self._max_samples:
-                self._metrics[name] = samples[-self._max_samples :]
+                self._metrics[name] = samples = samples[-self._max_samples :]
+
+            self._refresh_p95(name, samples)
+
+    def _check_slow_call(self, name: str, sample: MetricSample) -> None:
+        """Log a warning if sample is far slower than the metric's P95."""
+        entry = self._p95.get(name)
+        if entry is None:
+            return
+        p95 = entry[1]
+        if sample.duration > p95 * METRIC_SLOW_CALL_FACTOR:
+            logger.warning(
+                f"Slow call: {name} took {sample.duration * 1000:.0f}ms "
+                f"(P95 {p95 * 1000:.0f}ms)"
+                + (f", tags={sample.tags}" if sample.tags else "")
+            )
+
+    def _refresh_p95(self, name: str, samples: list[MetricSample]) -> None:
+        """Recompute the metric's P95 once enough new samples arrived."""
+        if len(samples) < METRIC_SLOW_CALL_MIN_SAMPLES:
+            return
+        since, p95 = self._p95.get(name, (METRIC_SLOW_CALL_REFRESH, 0.0))
+        since += 1
+        if since >= METRIC_SLOW_CALL_REFRESH:
+            durations = sorted(s.duration for s in samples)
+            self._p95[name] = (0, _percentile(durations, METRIC_PERCENTILE_95))
+        else:
+            self._p95[name] = (since, p95)
 
     async def get_summary(self, name: str) -> MetricSummary | None:
         """Get summary statistics for a metric.
@@ -186,8 +225,10 @@ class MetricsCollector:
         async with self._lock:
             if name:
                 self._metrics.pop(name, None)
+                self._p95.pop(name, None)
             else:
                 self._metrics.clear()
+                self._p95.clear()
 
 
 # Global metrics collector instance
@@ -240,6 +281,9 @@ async def get_all_metrics() -> dict[str, MetricSummary]:
 def track_performance(metric_name: str | None = None):
     """Decorator to track function performance.
 
+    When metrics are disabled (the default), functions are returned
+    unwrapped, so decorated tools pay no per-call cost.
+
     Args:
         metric_name: Custom metric name (defaults to function name)
 
@@ -248,6 +292,9 @@ def track_performance(metric_name: str | None = None):
     """
 
     def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
         name = metric_name or f"{func.__module__}.{func.__name__}"
 
         @functools.wraps(func)
@@ -12,6 +12,8 @@ import os
 from datetime import datetime, timedelta
 from typing import Any
 
+from ..utils.json_utils import dumps
+
 logger = logging.getLogger(__name__)
 
 # Cache configuration
@@ -96,13 +98,11 @@ def set_cached_response(
         response: Response data to cache
     """
     # Check response size limit
-    import json
     import sys
 
     # Better size estimation using JSON serialization
     try:
-        response_json = json.dumps(response)
-        response_size = len(response_json.encode("utf-8"))
+        response_size = len(dumps(response))
     except (TypeError, ValueError):
         # If can't serialize, use sys.getsizeof
         response_size = sys.getsizeof(response)
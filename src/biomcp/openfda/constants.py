@@ -21,6 +21,7 @@ OPENFDA_DEVICE_RECALL_URL = f"{OPENFDA_BASE_URL}/device/recall.json"
 # API limits
 OPENFDA_DEFAULT_LIMIT = 25
 OPENFDA_MAX_LIMIT = 100
+OPENFDA_MAX_SKIP = 25000  # skip + limit may not exceed this
 OPENFDA_RATE_LIMIT_NO_KEY = 40  # requests per minute without key
 OPENFDA_RATE_LIMIT_WITH_KEY = 240  # requests per minute with key
 
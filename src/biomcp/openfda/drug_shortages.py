@@ -23,6 +23,7 @@ except ImportError:
     HAS_FCNTL = False
 
 from ..http_client import request_api
+from ..utils.json_utils import dumps_pretty, loads
 from .constants import OPENFDA_DEFAULT_LIMIT, OPENFDA_SHORTAGE_DISCLAIMER
 from .drug_shortages_detail_helpers import (
     format_shortage_details_section,
@@ -95,12 +96,12 @@ def _read_cache_file() -> dict[str, Any] | None:
         return None
 
     try:
-        with open(CACHE_FILE) as f:
+        with open(CACHE_FILE, encoding="utf-8") as f:
             # Acquire shared lock for reading (Unix only)
             if HAS_FCNTL:
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
             try:
-                data = json.load(f)
+                data = loads(f.read())
             finally:
                 # Release lock (Unix only)
                 if HAS_FCNTL:
@@ -125,12 +126,12 @@ def _write_cache_file(data: dict[str, Any]) -> None:
     """Write data to cache file with atomic operation."""
     temp_file = CACHE_FILE.with_suffix(".tmp")
     try:
-        with open(temp_file, "w") as f:
+        with open(temp_file, "w", encoding="utf-8") as f:
             # Acquire exclusive lock for writing (Unix only)
             if HAS_FCNTL:
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
-                json.dump(data, f, indent=2)
+                f.write(dumps_pretty(data))
             finally:
                 # Release lock (Unix only)
                 if HAS_FCNTL:
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any
 
+from .constants import OPENFDA_MAX_SKIP
+
 logger = logging.getLogger(__name__)
 
 # Maximum lengths for different input types
@@ -154,7 +156,7 @@ def validate_limit(limit: int | None, max_limit: int = 100) -> int:
     return limit
 
 
-def validate_skip(skip: int | None, max_skip: int = 10000) -> int:
+def validate_skip(skip: int | None, max_skip: int = OPENFDA_MAX_SKIP) -> int:
     """
     Validate and constrain skip/offset parameter.
 
@@ -13,6 +13,7 @@ from .cache import (
     is_cacheable_request,
     set_cached_response,
 )
+from .constants import OPENFDA_MAX_SKIP
 from .exceptions import (
     OpenFDAConnectionError,
     OpenFDARateLimitError,
@@ -56,6 +57,20 @@ async def make_openfda_request(  # noqa: C901
     Returns:
         Tuple of (response_data, error_message)
     """
+    # OpenFDA rejects a page that ends past this offset, and
+    # build_safe_query would clamp it to a different page; report it
+    # instead of spending a request on it
+    skip = params.get("skip")
+    limit = params.get("limit")
+    if (
+        isinstance(skip, int)
+        and skip + (limit if isinstance(limit, int) else 0) > OPENFDA_MAX_SKIP
+    ):
+        return None, (
+            f"Page is beyond the first {OPENFDA_MAX_SKIP} results the FDA "
+            "API can page through. Narrow the search to see later results."
+        )
+
     # Validate and sanitize input parameters
     safe_params = build_safe_query(params)
 
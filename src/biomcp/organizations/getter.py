@@ -1,13 +1,27 @@
 """Get specific organization details via NCI CTS API."""
 
+import copy
 import logging
 from typing import Any
 
-from ..constants import NCI_ORGANIZATIONS_URL
-from ..integrations.cts_api import CTSAPIError, make_cts_request
+from ..constants import (
+    DETAILS_CACHE_MAX_SIZE,
+    DETAILS_CACHE_TTL,
+    NCI_ORGANIZATIONS_URL,
+)
+from ..integrations.cts_api import (
+    CTSAPIError,
+    make_cts_request,
+    uses_server_api_key,
+)
+from ..utils.request_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+_organization_cache = get_cache(
+    "organization_details", max_size=DETAILS_CACHE_MAX_SIZE
+)
+
 
 async def get_organization(
     org_id: str,
@@ -26,6 +40,12 @@ async def get_organization(
     Raises:
         CTSAPIError: If the API request fails or organization not found
     """
+    if uses_server_api_key(api_key):
+        cached = await _organization_cache.get(org_id)
+        if cached is not None:
+            logger.debug(f"Returning cached organization details for {org_id}")
+            return copy.deepcopy(cached)
+
     try:
         # Make API request
         url = f"{NCI_ORGANIZATIONS_URL}/{org_id}"
@@ -37,11 +57,17 @@ async def get_organization(
         # Return the organization data
         # Handle different possible response formats
         if "data" in response:
-            return response["data"]
+            result = response["data"]
         elif "organization" in response:
-            return response["organization"]
+            result = response["organization"]
         else:
-            return response
+            result = response
+
+        if uses_server_api_key(api_key):
+            await _organization_cache.set(
+                org_id, copy.deepcopy(result), DETAILS_CACHE_TTL
+            )
+        return result
 
     except CTSAPIError:
         raise
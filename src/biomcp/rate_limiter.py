@@ -2,14 +2,17 @@
 
 import asyncio
 import time
+import weakref
 from collections import defaultdict
 from contextlib import asynccontextmanager
 
 from .constants import (
     DEFAULT_BURST_SIZE,
+    DEFAULT_HOST_CONCURRENCY,
     DEFAULT_RATE_LIMIT_PER_SECOND,
 )
 from .exceptions import BioMCPError
+from .metrics import Timer
 
 
 class RateLimitExceeded(BioMCPError):
@@ -101,6 +104,10 @@ class DomainRateLimiter:
             self.limiters[domain] = RateLimiter(rps, int(burst))
         return self.limiters[domain]
 
+    async def acquire(self, domain: str) -> None:
+        """Wait for a request token for a domain."""
+        await self.get_limiter(domain).acquire()
+
     @asynccontextmanager
     async def limit(self, domain: str):
         """Rate limit context manager for a domain."""
@@ -109,6 +116,51 @@ class DomainRateLimiter:
             yield
 
 
+class HostLimiter:
+    """Bound the number of in-flight requests per upstream host.
+
+    All HTTP/1.1 requests share one connection pool, so without a per-host
+    cap a burst against one slow API can hold every connection and stall
+    requests to the others. Semaphores are kept per event loop, as they
+    cannot be shared across loops.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_HOST_CONCURRENCY):
+        """Initialize host limiter.
+
+        Args:
+            max_concurrent: Maximum concurrent requests per host
+        """
+        self.max_concurrent = max_concurrent
+        self._loop_semaphores: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get or create the current event loop's semaphore for host."""
+        loop = asyncio.get_running_loop()
+        semaphores = self._loop_semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._loop_semaphores[loop] = {}
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(
+                self.max_concurrent
+            )
+        return semaphore
+
+    @asynccontextmanager
+    async def limit(self, host: str):
+        """Hold one of host's request slots, timing the wait for it."""
+        semaphore = self.get_semaphore(host)
+        async with Timer("semaphore.wait_time", tags={"host": host}):
+            await semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
 class SlidingWindowRateLimiter:
     """Sliding window rate limiter for user/IP based limiting."""
 
@@ -155,6 +207,7 @@ class SlidingWindowRateLimiter:
 
 # Global instances
 domain_limiter = DomainRateLimiter()
+host_limiter = HostLimiter()
 user_limiter = SlidingWindowRateLimiter(
     requests=1000, window_seconds=3600
 )  # 1000 req/hour
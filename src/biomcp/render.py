@@ -1,11 +1,15 @@
-import json
+import functools
 import re
 import textwrap
 from typing import Any
 
+from .utils.json_utils import loads
+
 MAX_WIDTH = 72
 
 REMOVE_MULTI_LINES = re.compile(r"\s+")
+ACRONYM_BOUNDARY = re.compile(r"(?<=[A-Z])(?=[A-Z][a-z])")
+CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
 
 
 def dedupe_list_keep_order(lst: list[Any]) -> list[Any]:
@@ -16,9 +20,10 @@ def dedupe_list_keep_order(lst: list[Any]) -> list[Any]:
     seen = set()
     data = []
     for x in lst:
-        if str(x) not in seen:
+        key = str(x)
+        if key not in seen:
             data.append(x)
-            seen.add(str(x))
+            seen.add(key)
     return data
 
 
@@ -30,7 +35,7 @@ def to_markdown(data: str | list | dict) -> str:
     :return: A string containing the generated Markdown output.
     """
     if isinstance(data, str):
-        data = json.loads(data)
+        data = loads(data)
 
     if isinstance(data, list):
         new_data = []
@@ -199,13 +204,15 @@ def render_key_value(lines: list[str], key: str, value: Any) -> None:
         append_line(lines, f"{label}: {val_str}")
 
 
+# The same few field names repeat for every record (e.g. each trial site)
+@functools.lru_cache(maxsize=1024)
 def transform_key(s: str) -> str:
     # Replace underscores with spaces.
     s = s.replace("_", " ")
     # Insert a space between an uppercase letter followed by an uppercase letter then a lowercase letter.
-    s = re.sub(r"(?<=[A-Z])(?=[A-Z][a-z])", " ", s)
+    s = ACRONYM_BOUNDARY.sub(" ", s)
     # Insert a space between a lowercase letter or digit and an uppercase letter.
-    s = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", s)
+    s = CAMEL_BOUNDARY.sub(" ", s)
 
     words = s.split()
     transformed_words = []
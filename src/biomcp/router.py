@@ -296,7 +296,9 @@ def format_results(
     # Format each result
     for result in results:
         try:
-            formatted_result = handler_class.format_result(result)
+            formatted_result = handler_class.format_result(
+                result, include_metadata=False
+            )
             # Ensure the result has the required OpenAI MCP fields
             openai_result = {
                 "id": formatted_result.get("id", ""),
@@ -1436,7 +1438,9 @@ async def _unified_search(  # noqa: C901
 
             for item in items_to_process:
                 try:
-                    formatted_result = handler_class.format_result(item)
+                    formatted_result = handler_class.format_result(
+                        item, include_metadata=False
+                    )
                     # Ensure OpenAI MCP format
                     openai_result = {
                         "id": formatted_result.get("id", ""),
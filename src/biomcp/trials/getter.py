@@ -1,10 +1,10 @@
-import json
 import logging
 from ssl import TLSVersion
 from typing import Annotated, Any
 
 from .. import StrEnum, http_client, render
 from ..constants import CLINICAL_TRIALS_BASE_URL
+from ..utils.json_utils import dumps_pretty
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +119,7 @@ async def get_trial(
         }
 
     if output_json:
-        return json.dumps(data_to_return, indent=2)
+        return dumps_pretty(data_to_return)
     else:
         return render.to_markdown(data_to_return)
 
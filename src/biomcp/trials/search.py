@@ -1,4 +1,3 @@
-import json
 import logging
 from ssl import TLSVersion
 from typing import Annotated
@@ -8,6 +7,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from .. import StrEnum, ensure_list, http_client, render
 from ..constants import CLINICAL_TRIALS_BASE_URL
 from ..integrations import BioThingsClient
+from ..utils.json_utils import dumps_pretty
 
 logger = logging.getLogger(__name__)
 
@@ -797,7 +797,7 @@ async def search_trials(
     if data and not output_json:
         return render.to_markdown(data)
     else:
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
 
 
 async def _trial_searcher(
@@ -1004,7 +1004,7 @@ async def search_trials_unified(
         results = await search_trials_nci(query, api_key)
 
         if output_json:
-            return json.dumps(results, indent=2)
+            return dumps_pretty(results)
         else:
             return format_nci_trial_results(results)
     else:
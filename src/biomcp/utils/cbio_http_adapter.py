@@ -16,7 +16,6 @@ Example:
         print(f"Gene ID: {data.get('entrezGeneId')}")
 """
 
-import json
 from typing import Any
 
 from ..http_client import RequestError, request_api
@@ -60,20 +59,15 @@ class CBioHTTPAdapter:
         """
         url = f"{self.base_url}{path}"
 
-        # Prepare request with headers
-        request_params = params or {}
-        if self.headers:
-            # Need to pass headers through params for centralized client
-            request_params["_headers"] = json.dumps(self.headers)
-
         result, error = await request_api(
             url=url,
-            request=request_params,
+            request=params or {},
             method="GET",
             domain="cbioportal",  # For rate limiting
             endpoint_key=endpoint_key,
             cache_ttl=cache_ttl,
             enable_retry=True,
+            headers=self.headers or None,
         )
 
         return result, error
@@ -98,10 +92,6 @@ class CBioHTTPAdapter:
         """
         url = f"{self.base_url}{path}"
 
-        # Add headers to request
-        if self.headers:
-            data["_headers"] = json.dumps(self.headers)
-
         result, error = await request_api(
             url=url,
             request=data,
@@ -110,6 +100,7 @@ class CBioHTTPAdapter:
             endpoint_key=endpoint_key,
             cache_ttl=cache_ttl,
             enable_retry=True,
+            headers=self.headers or None,
         )
 
         return result, error
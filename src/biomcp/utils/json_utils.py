@@ -0,0 +1,61 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(content: str | bytes) -> Any:
+    """Parse JSON text.
+
+    Input orjson rejects but the stdlib accepts (NaN, Infinity) is
+    retried with the stdlib. Unlike the stdlib, orjson reads integers
+    wider than 64 bits as floats. Raises json.JSONDecodeError on invalid
+    input.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize compactly to UTF-8 bytes, e.g. for a request body."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def dumps_canonical(data: Any) -> bytes:
+    """Serialize with sorted keys and no whitespace, for hashing."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def dumps_pretty(data: Any) -> str:
+    """Serialize with two-space indentation for user-facing output."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2)
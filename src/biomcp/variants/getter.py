@@ -1,11 +1,11 @@
 """Getter module for retrieving variant details."""
 
-import json
 import logging
 from typing import Annotated
 
 from .. import ensure_list, http_client, render
 from ..constants import MYVARIANT_GET_URL
+from ..utils.json_utils import dumps_pretty
 from .external import ExternalVariantAggregator, format_enhanced_annotations
 from .filters import filter_variants
 from .links import inject_links
@@ -73,7 +73,7 @@ async def get_variant(
         data_to_return = [{"error": f"Error {error.code}: {error.message}"}]
 
     if output_json:
-        return json.dumps(data_to_return, indent=2)
+        return dumps_pretty(data_to_return)
     else:
         return render.to_markdown(data_to_return)
 
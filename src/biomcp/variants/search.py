@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Annotated, Any
 
@@ -6,6 +5,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from .. import StrEnum, ensure_list, http_client, render
 from ..constants import MYVARIANT_QUERY_URL
+from ..utils.json_utils import dumps_pretty
 from .filters import filter_variants
 from .links import inject_links
 
@@ -18,6 +18,7 @@ class ClinicalSignificance(StrEnum):
     UNCERTAIN_SIGNIFICANCE = "uncertain significance"
     LIKELY_BENIGN = "likely benign"
     BENIGN = "benign"
+    CONFLICTING = "conflicting interpretations of pathogenicity"
 
 
 class PolyPhenPrediction(StrEnum):
@@ -253,11 +254,11 @@ async def search_variants(
         return result
     else:
         if cbioportal_summary:
-            return json.dumps(
-                {"cbioportal_summary": cbioportal_summary, "variants": data},
-                indent=2,
-            )
-        return json.dumps(data, indent=2)
+            return dumps_pretty({
+                "cbioportal_summary": cbioportal_summary,
+                "variants": data,
+            })
+        return dumps_pretty(data)
 
 
 async def _variant_searcher(
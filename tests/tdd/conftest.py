@@ -1,8 +1,11 @@
+from collections import OrderedDict
+from contextlib import nullcontext
 from pathlib import Path
 
 from pytest import fixture
 
 from biomcp import http_client
+from biomcp.utils import request_cache
 
 
 @fixture
@@ -20,19 +23,38 @@ class DummyCache:
     def get(self, key, default=None):
         return self.store.get(key, default)
 
+    def transact(self, retry=False):
+        return nullcontext()
+
     @property
     def count(self):
-        return len(self.store)
+        """Number of raw responses stored, once queued writes land.
+
+        Parsed copies stored alongside them under "parsed:" keys are
+        not counted.
+        """
+        http_client.flush_cache_writes()
+        return sum(not key.startswith("parsed:") for key in self.store)
 
     def close(self):
         self.store.clear()
 
 
+@fixture(autouse=True)
+def empty_request_caches():
+    """Keep in-process result caches from leaking between tests."""
+    for cache in request_cache._named_caches.values():
+        cache.cache.clear()
+    yield
+
+
 @fixture
-def http_cache():
+def http_cache(monkeypatch):
     cache = DummyCache()
-    http_client._cache = cache
+    monkeypatch.setattr(http_client, "get_cache", lambda: cache)
+    monkeypatch.setattr(http_client, "_memory_cache", OrderedDict())
     yield cache
+    http_client.flush_cache_writes()
     cache.close()
 
 
@@ -100,6 +100,23 @@ class TestDrugGetter:
             == "https://www.drugbank.ca/drugs/DB00619"
         )
 
+    @pytest.mark.asyncio
+    async def test_get_drug_json_output_without_links(self, monkeypatch):
+        """Test JSON output for a drug with no linkable database IDs."""
+
+        async def mock_request_api(url, request, method, domain):
+            return ({"_id": "CID1", "name": "Testdrug"}, None)
+
+        monkeypatch.setattr("biomcp.http_client.request_api", mock_request_api)
+
+        result = await get_drug("CID1", output_json=True)
+        data = json.loads(result)
+
+        assert data["drug_id"] == "CID1"
+        assert data["name"] == "Testdrug"
+        assert "_links" not in data
+        assert "drugbank_id" not in data  # None fields are excluded
+
     @pytest.mark.asyncio
     async def test_drug_not_found(self, monkeypatch):
         """Test drug not found."""
@@ -149,3 +166,26 @@ class TestDrugGetter:
 
         # When an exception occurs, it's caught and the drug is reported as not found
         assert "Drug 'imatinib' not found in MyChem.info" in result
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(
+        self, monkeypatch, mock_drug_response
+    ):
+        """Only successful results are cached and reused."""
+        calls = 0
+        responses = [(None, None), (mock_drug_response, None)]
+
+        async def mock_request_api(url, request, method, domain):
+            nonlocal calls
+            calls += 1
+            return responses[min(calls - 1, 1)]
+
+        monkeypatch.setattr("biomcp.http_client.request_api", mock_request_api)
+
+        assert "not found" in await get_drug("DB00619")
+        first = await get_drug("DB00619")
+        second = await get_drug("DB00619")
+
+        assert "## Drug: Imatinib" in first
+        assert second == first
+        assert calls == 2
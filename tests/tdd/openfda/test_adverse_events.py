@@ -135,6 +135,31 @@ async def test_search_adverse_events_error():
         assert "API rate limit exceeded" in result
 
 
+@pytest.mark.asyncio
+async def test_search_adverse_events_page_past_skip_cap():
+    """A page ending past the skip cap is reported without calling the API."""
+    with patch("biomcp.openfda.utils.request_api") as mock_api:
+        result = await search_adverse_events(
+            drug="aspirin", limit=25, skip=24990
+        )
+
+    mock_api.assert_not_called()
+    assert "Error searching adverse events" in result
+    assert "Narrow the search" in result
+
+
+@pytest.mark.asyncio
+async def test_search_adverse_events_deep_page_within_skip_cap():
+    """Pages ending within the skip cap are requested unchanged."""
+    with patch(
+        "biomcp.openfda.utils.request_api",
+        return_value=({"results": []}, None),
+    ) as mock_api:
+        await search_adverse_events(drug="aspirin", limit=25, skip=24975)
+
+    assert mock_api.call_args.kwargs["request"]["skip"] == 24975
+
+
 @pytest.mark.asyncio
 async def test_get_adverse_event_detail():
     """Test getting detailed adverse event report."""
@@ -0,0 +1,64 @@
+"""Tests for the shared cBioPortal summary helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from biomcp.cbioportal_helper import (
+    get_cbioportal_summary_for_genes,
+    get_variant_cbioportal_summary,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gene_summaries_share_one_fetch():
+    """Concurrent misses for the same genes build the summary once."""
+
+    async def slow_summary(request):
+        await asyncio.sleep(0.01)
+        return f"summary for {request.genes[0]}"
+
+    with patch(
+        "biomcp.articles.unified._get_cbioportal_summary",
+        side_effect=slow_summary,
+    ) as mock_summary:
+        results = await asyncio.gather(
+            *(
+                get_cbioportal_summary_for_genes(["BRAF"], {"keywords": None})
+                for _ in range(3)
+            )
+        )
+        # Later calls are answered from the cache
+        again = await get_cbioportal_summary_for_genes(
+            ["BRAF"], {"keywords": None}
+        )
+        other = await get_cbioportal_summary_for_genes(["TP53", "BRAF"])
+
+    assert results == ["summary for BRAF"] * 3
+    assert again == "summary for BRAF"
+    assert other == "summary for TP53"
+    assert mock_summary.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_variant_summary_is_not_cached():
+    """A summary that could not be built is fetched again next time."""
+    client = AsyncMock()
+    client.get_gene_search_summary.side_effect = [None, {"gene": "BRAF"}]
+
+    with (
+        patch(
+            "biomcp.variants.cbioportal_search.CBioPortalSearchClient",
+            return_value=client,
+        ),
+        patch(
+            "biomcp.variants.cbioportal_search.format_cbioportal_search_summary",
+            return_value="## BRAF",
+        ),
+    ):
+        assert await get_variant_cbioportal_summary("BRAF") is None
+        assert await get_variant_cbioportal_summary("BRAF") == "## BRAF"
+        assert await get_variant_cbioportal_summary("BRAF") == "## BRAF"
+
+    assert client.get_gene_search_summary.call_count == 2
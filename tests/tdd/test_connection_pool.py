@@ -3,16 +3,22 @@
 import asyncio
 import ssl
 import weakref
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from biomcp import connection_pool
 from biomcp.connection_pool import (
     EventLoopConnectionPools,
     close_all_pools,
     get_connection_pool,
+    http2_host,
+    resolve_verify,
+    url_host,
 )
+from biomcp.constants import HTTP_TIMEOUT_SECONDS
+from biomcp.http_client_simple import execute_http_request
 
 
 @pytest.fixture
@@ -158,6 +164,20 @@ async def test_global_close_all_pools():
     assert len(_pool_manager._loop_pools) == 0
 
 
+@pytest.mark.asyncio
+async def test_existing_pool_returned_without_lock(pool_manager):
+    """Lookups of an open pool do not wait on the creation lock."""
+    timeout = httpx.Timeout(30)
+    pool = await pool_manager.get_pool(verify=True, timeout=timeout)
+
+    async with pool_manager._lock:
+        again = await asyncio.wait_for(
+            pool_manager.get_pool(verify=True, timeout=timeout), 1
+        )
+
+    assert again is pool
+
+
 @pytest.mark.asyncio
 async def test_concurrent_pool_creation(pool_manager):
     """Test thread-safe pool creation under concurrent access."""
@@ -184,3 +204,121 @@ async def test_connection_pool_limits():
     # Verify pool was created (actual limits are internal to httpx)
     assert pool is not None
     assert isinstance(pool, httpx.AsyncClient)
+
+
+@pytest.mark.parametrize(
+    "url,available,flag,expected",
+    [
+        (
+            "https://clinicaltrials.gov/api/v2/studies",
+            True,
+            "true",
+            "clinicaltrials.gov",
+        ),
+        ("https://myvariant.info/v1/query", True, "true", "myvariant.info"),
+        ("https://mygene.info/v3/query", True, "true", None),
+        ("https://myvariant.info/v1/query", False, "true", None),
+        ("https://myvariant.info/v1/query", True, "false", None),
+    ],
+)
+def test_http2_host_selection(monkeypatch, url, available, flag, expected):
+    """HTTP/2 is used only for allowlisted hosts when h2 is installed."""
+    monkeypatch.setattr(connection_pool, "HTTP2_AVAILABLE", available)
+    monkeypatch.setenv("BIOMCP_HTTP2", flag)
+    assert http2_host(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_http2_pools_are_per_host(pool_manager):
+    """Each HTTP/2 host gets its own pool, separate from HTTP/1.1."""
+    timeout = httpx.Timeout(30)
+    with patch.object(
+        pool_manager,
+        "_create_client",
+        side_effect=lambda *args, **kwargs: MagicMock(is_closed=False),
+    ) as mock_create:
+        h1 = await pool_manager.get_pool(True, timeout)
+        h2_a = await pool_manager.get_pool(True, timeout, "myvariant.info")
+        h2_b = await pool_manager.get_pool(True, timeout, "clinicaltrials.gov")
+        again = await pool_manager.get_pool(True, timeout, "myvariant.info")
+
+    assert len({id(h1), id(h2_a), id(h2_b)}) == 3
+    assert again is h2_a
+    assert [c.kwargs["http2"] for c in mock_create.call_args_list] == [
+        False,
+        True,
+        True,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_http_request_uses_shared_pool(monkeypatch):
+    """Pooled requests reuse the event-loop pool instead of a new client."""
+    monkeypatch.setenv("BIOMCP_USE_CONNECTION_POOL", "true")
+    monkeypatch.setattr(connection_pool, "HTTP2_AVAILABLE", True)
+    client = AsyncMock()
+    client.get.return_value = MagicMock(status_code=200, text="{}")
+
+    with patch.object(
+        connection_pool, "get_connection_pool", return_value=client
+    ) as mock_get_pool:
+        status, _ = await execute_http_request(
+            "GET", "https://myvariant.info/v1/query", {"q": "x"}, True
+        )
+
+    assert status == 200
+    assert mock_get_pool.call_args.args[2] == "myvariant.info"
+    client.aclose.assert_not_called()
+
+
+def test_verify_settings_share_ssl_context():
+    """Each verify setting maps to one SSLContext built once."""
+    assert resolve_verify(True) is resolve_verify(True)
+    assert resolve_verify(True).verify_mode == ssl.CERT_REQUIRED
+    assert resolve_verify(False).verify_mode == ssl.CERT_NONE
+
+    context = ssl.create_default_context()
+    assert resolve_verify(context) is context
+
+
+@pytest.mark.asyncio
+async def test_pooled_request_passes_its_own_timeout(monkeypatch):
+    """The request timeout is applied per call, not taken from the pool."""
+    monkeypatch.setenv("BIOMCP_USE_CONNECTION_POOL", "true")
+    client = AsyncMock()
+    client.get.return_value = MagicMock(status_code=200, text="{}")
+
+    with patch.object(
+        connection_pool, "get_connection_pool", return_value=client
+    ):
+        await execute_http_request("GET", "https://a", {}, True)
+
+    assert client.get.call_args.kwargs["timeout"] == httpx.Timeout(
+        HTTP_TIMEOUT_SECONDS
+    )
+
+
+def test_url_host_is_memoized():
+    """Hostnames are parsed once per URL."""
+    url_host.cache_clear()
+    for _ in range(3):
+        assert url_host("https://MyVariant.info/v1/query") == "myvariant.info"
+    assert url_host("not a url") is None
+
+    info = url_host.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_simple_close_all_pools_awaits_every_close():
+    """Legacy pools are closed before close_all_pools returns."""
+    from biomcp import http_client_simple
+
+    pool = await http_client_simple.get_connection_pool(
+        True, httpx.Timeout(30)
+    )
+
+    await http_client_simple.close_all_pools()
+
+    assert pool.is_closed
+    assert http_client_simple._connection_pools == {}
@@ -2,9 +2,13 @@
 
 import pytest
 
-from biomcp.constants import DEFAULT_TITLE
+from biomcp.constants import DEFAULT_TITLE, SNIPPET_LENGTH
 from biomcp.domain_handlers import (
     ArticleHandler,
+    NCIBiomarkerHandler,
+    NCIDiseaseHandler,
+    NCIInterventionHandler,
+    NCIOrganizationHandler,
     TrialHandler,
     VariantHandler,
     get_domain_handler,
@@ -19,8 +23,7 @@ class TestArticleHandler:
         article = {
             "pmid": "12345",
             "title": "Test Article Title",
-            "abstract": "This is a test abstract that is longer than 200 characters. "
-            * 5,
+            "abstract": "A" * (SNIPPET_LENGTH + 100),
             "pub_year": "2023",
             "journal": "Test Journal",
             "authors": ["Smith J", "Doe J", "Johnson A", "Williams B"],
@@ -30,7 +33,7 @@ class TestArticleHandler:
 
         assert result["id"] == "12345"
         assert result["title"] == "Test Article Title"
-        assert len(result["snippet"]) == 203  # 200 + "..."
+        assert len(result["snippet"]) == SNIPPET_LENGTH + 3
         assert result["snippet"].endswith("...")
         assert result["url"] == "https://pubmed.ncbi.nlm.nih.gov/12345/"
         assert result["metadata"]["year"] == "2023"
@@ -54,7 +57,7 @@ class TestArticleHandler:
 
         assert result["id"] == "10.1101/2023.01.01.12345"
         assert result["title"] == "Preprint Title"
-        assert result["snippet"] == "Short abstract..."
+        assert result["snippet"] == "Short abstract"  # Not truncated
         assert (
             result["url"]
             == "https://www.biorxiv.org/content/10.1101/2023.01.01.12345"
@@ -89,6 +92,37 @@ class TestArticleHandler:
 
         assert result["metadata"]["year"] == "2023"
 
+    def test_format_article_short_author_list(self):
+        """Test that short author lists are passed through unchanged."""
+        authors = ["Smith J", "Doe J"]
+        article = {"pmid": "123", "title": "Test", "authors": authors}
+
+        result = ArticleHandler.format_result(article)
+
+        assert result["metadata"]["authors"] == ["Smith J", "Doe J"]
+
+    def test_format_article_large_author_list(self):
+        """Test that consortium-sized author lists are truncated."""
+        authors = [f"Author {i}" for i in range(2000)]
+        article = {"pmid": "123", "title": "Test", "authors": authors}
+
+        result = ArticleHandler.format_result(article)
+
+        assert result["metadata"]["authors"] == [
+            "Author 0",
+            "Author 1",
+            "Author 2",
+        ]
+        assert len(authors) == 2000  # Input is left untouched
+
+    def test_format_article_null_authors(self):
+        """Test that a null author list is formatted as empty."""
+        article = {"pmid": "123", "title": "Test", "authors": None}
+
+        result = ArticleHandler.format_result(article)
+
+        assert result["metadata"]["authors"] == []
+
     def test_format_article_title_normalization(self):
         """Test that article title whitespace is normalized."""
         article = {
@@ -104,6 +138,18 @@ class TestArticleHandler:
 class TestTrialHandler:
     """Test TrialHandler class."""
 
+    def test_long_summary_is_truncated_with_ellipsis(self):
+        """Test that only summaries past the snippet length are marked."""
+        long_trial = {"nct_id": "NCT1", "brief_summary": "S" * SNIPPET_LENGTH}
+        cut_trial = {**long_trial, "brief_summary": "S" * (SNIPPET_LENGTH + 1)}
+
+        assert not TrialHandler.format_result(long_trial)["snippet"].endswith(
+            "..."
+        )
+        assert TrialHandler.format_result(cut_trial)["snippet"] == (
+            "S" * SNIPPET_LENGTH + "..."
+        )
+
     def test_format_trial_api_v2(self):
         """Test formatting trial with API v2 structure."""
         trial = {
@@ -204,10 +250,62 @@ class TestTrialHandler:
 
         assert result["metadata"]["phase"] == ""
 
+    def test_format_results_batch(self):
+        """Test formatting a batch of trials sharing one structure."""
+        trials = [
+            {"NCT Number": "NCT1", "Study Title": "First"},
+            {"NCT Number": "NCT2", "Study Title": "Second"},
+        ]
+
+        results = TrialHandler.format_results(trials)
+
+        assert [r["id"] for r in results] == ["NCT1", "NCT2"]
+        assert [r["title"] for r in results] == ["First", "Second"]
+
+    def test_format_results_matches_format_result(self):
+        """Test batch formatting gives the same output as single formatting."""
+        trials = [
+            {
+                "protocolSection": {
+                    "identificationModule": {
+                        "nctId": f"NCT{i}",
+                        "briefTitle": f"Trial {i}",
+                    },
+                    "designModule": {"phases": ["PHASE2"]},
+                }
+            }
+            for i in range(3)
+        ]
+
+        assert TrialHandler.format_results(trials) == [
+            TrialHandler.format_result(trial) for trial in trials
+        ]
+
+    def test_format_results_empty(self):
+        """Test formatting an empty batch."""
+        assert TrialHandler.format_results([]) == []
+
 
 class TestVariantHandler:
     """Test VariantHandler class."""
 
+    def test_format_variant_null_subrecords(self):
+        """Test that explicit nulls for nested records are tolerated."""
+        variant = {
+            "_id": "chr1:g.1A>G",
+            "dbnsfp": None,
+            "dbsnp": {"gene": None, "rsid": None},
+            "clinvar": None,
+            "cadd": None,
+        }
+
+        result = VariantHandler.format_result(variant)
+
+        assert result["title"] == "chr1:g.1A>G"
+        assert result["url"] == ""
+        assert result["metadata"]["gene"] == ""
+        assert result["metadata"]["consequence"] == ""
+
     def test_format_variant_complete(self):
         """Test formatting variant with complete data."""
         variant = {
@@ -306,6 +404,186 @@ class TestVariantHandler:
         assert result["url"] == ""
 
 
+class TestNCIHandlers:
+    """Test NCI vocabulary handler classes."""
+
+    def test_format_organization(self):
+        """Test organization snippet with type and location."""
+        org = {
+            "id": "ORG1",
+            "name": "Cancer Center",
+            "type": "Academic",
+            "city": "Boston",
+            "state": "MA",
+        }
+
+        result = NCIOrganizationHandler.format_result(org)
+
+        assert result["id"] == "ORG1"
+        assert result["snippet"] == "Type: Academic | Location: Boston, MA"
+
+    def test_format_organization_partial_location(self):
+        """Test organization snippet with only a state."""
+        result = NCIOrganizationHandler.format_result({"state": "MA"})
+
+        assert result["title"] == "Unknown Organization"
+        assert result["snippet"] == "Location: MA"
+
+    def test_format_organization_no_details(self):
+        """Test organization snippet fallback."""
+        result = NCIOrganizationHandler.format_result({"id": "ORG2"})
+
+        assert result["snippet"] == "No details available"
+
+    def test_format_organization_null_fields(self):
+        """Test organization falls back past null fields."""
+        org = {
+            "id": None,
+            "org_id": "ORG3",
+            "name": None,
+            "type": None,
+            "category": "Industry",
+        }
+
+        result = NCIOrganizationHandler.format_result(org)
+
+        assert result["id"] == "ORG3"
+        assert result["title"] == "Unknown Organization"
+        assert result["snippet"] == "Type: Industry"
+
+    def test_format_intervention(self):
+        """Test intervention snippet with synonyms list."""
+        intervention = {
+            "id": "INT1",
+            "name": "Pembrolizumab",
+            "type": "Drug",
+            "synonyms": ["Keytruda", "MK-3475", "Lambrolizumab", "SCH 900475"],
+        }
+
+        result = NCIInterventionHandler.format_result(intervention)
+
+        assert result["snippet"] == (
+            "Type: Drug | Also known as: Keytruda, MK-3475, Lambrolizumab"
+        )
+
+    def test_format_intervention_string_synonyms(self):
+        """Test intervention snippet with a string synonym."""
+        result = NCIInterventionHandler.format_result({
+            "name": "Aspirin",
+            "synonyms": "ASA",
+        })
+
+        assert result["snippet"] == "Also known as: ASA"
+
+    def test_format_biomarker(self):
+        """Test biomarker title and snippet."""
+        biomarker = {
+            "id": "BIO1",
+            "name": "V600E Mutation",
+            "gene": "BRAF",
+            "type": "mutation",
+            "assay_type": "PCR",
+        }
+
+        result = NCIBiomarkerHandler.format_result(biomarker)
+
+        assert result["title"] == "BRAF - V600E Mutation"
+        assert result["snippet"] == "Type: mutation | Assay: PCR"
+
+    def test_format_biomarker_no_details(self):
+        """Test biomarker snippet fallback."""
+        result = NCIBiomarkerHandler.format_result({"name": "BRAF V600E"})
+
+        assert result["title"] == "BRAF V600E"
+        assert result["snippet"] == "Biomarker for trial eligibility"
+
+    def test_format_disease(self):
+        """Test disease snippet with more than three synonyms."""
+        disease = {
+            "id": "C1",
+            "name": "Melanoma",
+            "category": "maintype",
+            "synonyms": ["A", "B", "C", "D", "E"],
+        }
+
+        result = NCIDiseaseHandler.format_result(disease)
+
+        assert result["snippet"] == (
+            "Category: maintype | Also known as: A, B, C | and 2 more"
+        )
+
+    def test_format_disease_no_details(self):
+        """Test disease snippet fallback."""
+        result = NCIDiseaseHandler.format_result({"preferred_name": "X"})
+
+        assert result["title"] == "X"
+        assert result["snippet"] == "NCI cancer vocabulary term"
+
+
+HANDLER_CASES = [
+    ("article", {"pmid": "1", "title": "T"}),
+    ("article", {"doi": "10.1/x", "title": "T"}),
+    ("trial", {"nct_id": "NCT1", "brief_title": "T"}),
+    ("variant", {"_id": "chr1:g.1A>G"}),
+    ("gene", {"_id": "673", "symbol": "BRAF"}),
+    ("drug", {"_id": "D1", "name": "imatinib"}),
+    ("disease", {"_id": "MONDO:1", "name": "melanoma"}),
+    ("nci_organization", {"id": "O1", "name": "Org"}),
+    ("nci_intervention", {"id": "I1", "name": "Drug"}),
+    ("nci_biomarker", {"id": "B1", "name": "BRAF V600E"}),
+    ("nci_disease", {"id": "C1", "name": "Melanoma"}),
+]
+
+
+class TestIncludeMetadata:
+    """Test skipping metadata construction."""
+
+    @pytest.mark.parametrize("domain,result", HANDLER_CASES)
+    def test_format_without_metadata(self, domain, result):
+        """Test that metadata is omitted and other fields are unchanged."""
+        handler = get_domain_handler(domain)
+
+        full = handler.format_result(result)
+        slim = handler.format_result(result, include_metadata=False)
+
+        assert "metadata" in full
+        assert "metadata" not in slim
+        full.pop("metadata")
+        assert slim == full
+
+    def test_trial_batch_without_metadata(self):
+        """Test batch trial formatting without metadata."""
+        results = TrialHandler.format_results(
+            [{"nct_id": "NCT1"}, {"nct_id": "NCT2"}], include_metadata=False
+        )
+
+        assert all("metadata" not in r for r in results)
+
+
+class TestFormatResults:
+    """Test batch formatting on every handler."""
+
+    @pytest.mark.parametrize("domain,result", HANDLER_CASES)
+    @pytest.mark.parametrize("include_metadata", [True, False])
+    def test_matches_single_formatting(self, domain, result, include_metadata):
+        """Test that a batch formats like repeated single calls."""
+        handler = get_domain_handler(domain)
+        other = {**result, "title": "Other"}
+
+        batch = handler.format_results(
+            [result, other], include_metadata=include_metadata
+        )
+
+        assert batch == [
+            handler.format_result(r, include_metadata=include_metadata)
+            for r in (result, other)
+        ]
+
+    def test_empty_batch(self):
+        """Test that an empty batch formats to an empty list."""
+        assert get_domain_handler("gene").format_results([]) == []
+
+
 class TestGetDomainHandler:
     """Test get_domain_handler function."""
 
@@ -331,6 +609,19 @@ class TestGetDomainHandler:
 
         assert "Unknown domain: invalid" in str(exc_info.value)
 
+    def test_get_handler_is_memoized(self):
+        """Test that repeated lookups are served from the cache."""
+        get_domain_handler.cache_clear()
+
+        get_domain_handler("trial")
+        get_domain_handler("trial")
+        with pytest.raises(ValueError):
+            get_domain_handler("invalid")
+
+        info = get_domain_handler.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+
     def test_get_handler_case_sensitive(self):
         """Test that domain names are case sensitive."""
         # Should work with lowercase
@@ -0,0 +1,696 @@
+"""Tests for HTTP client cache keys and response caching."""
+
+import asyncio
+import json
+import math
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from ssl import TLSVersion
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from diskcache import FanoutCache
+from pydantic import BaseModel, Field
+
+from biomcp import http_client, http_client_simple, rate_limiter
+from biomcp.connection_pool import close_all_pools
+from biomcp.constants import (
+    AGGRESSIVE_MAX_RETRY_ATTEMPTS,
+    DEFAULT_MAX_RETRY_ATTEMPTS,
+)
+from biomcp.http_client import generate_cache_key, parse_response
+from biomcp.http_client_simple import execute_http_request
+from biomcp.retry import RetryConfig
+from biomcp.utils import json_utils
+
+
+def test_cache_key_without_params():
+    """Requests without params use the readable method:url form."""
+    assert (
+        generate_cache_key("get", "https://api.example.com/x", {})
+        == "GET:https://api.example.com/x"
+    )
+
+
+def test_cache_key_ignores_param_order():
+    """Param order does not change the key."""
+    key_a = generate_cache_key("GET", "https://a", {"q": "braf", "size": 10})
+    key_b = generate_cache_key("GET", "https://a", {"size": 10, "q": "braf"})
+    assert key_a == key_b
+    assert len(key_a) == 32
+
+
+def test_cache_key_distinguishes_requests():
+    """Different methods, URLs or params produce different keys."""
+    params = {"q": "braf"}
+    keys = {
+        generate_cache_key("GET", "https://a", params),
+        generate_cache_key("POST", "https://a", params),
+        generate_cache_key("GET", "https://b", params),
+        generate_cache_key("GET", "https://a", {"q": "kras"}),
+    }
+    assert len(keys) == 4
+
+
+def test_cache_key_stable_across_processes():
+    """Keys must match between interpreters so the disk cache can hit."""
+    code = (
+        "from biomcp.http_client import generate_cache_key;"
+        "print(generate_cache_key('GET', 'https://a', {'q': 'braf'}))"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert output == generate_cache_key("GET", "https://a", {"q": "braf"})
+
+
+def test_cache_key_stdlib_fallback(monkeypatch):
+    """Without xxhash the key is still a stable 128-bit digest."""
+    monkeypatch.setattr(http_client, "XXHASH_AVAILABLE", False)
+    key = generate_cache_key("GET", "https://a", {"q": "braf"})
+    assert key == generate_cache_key("GET", "https://a", {"q": "braf"})
+    assert len(key) == 32
+
+
+def test_cache_key_same_with_and_without_orjson(monkeypatch):
+    """orjson and stdlib json produce the same canonical form."""
+    params = {"size": 10, "q": "braf", "fields": ["a", "b"], "exact": True}
+    fast_key = generate_cache_key("GET", "https://a", params)
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+    assert generate_cache_key("GET", "https://a", params) == fast_key
+
+
+def test_cache_key_handles_big_integers():
+    """Values orjson cannot encode fall back to the stdlib serializer."""
+    key = generate_cache_key("GET", "https://a", {"id": 2**70})
+    assert len(key) == 32
+
+
+def test_parse_response_json_and_invalid_json():
+    """JSON bodies are parsed; malformed JSON surfaces as a 500 error."""
+    assert parse_response(200, '{"a": [1, 2]}') == ({"a": [1, 2]}, None)
+    result, error = parse_response(200, '{"a": ')
+    assert result is None
+    assert error.code == 500
+    assert "Invalid JSON response" in error.message
+
+
+def test_parse_response_accepts_nan():
+    """Bodies orjson rejects but the stdlib accepts still parse."""
+    result, error = parse_response(200, '{"score": NaN, "max": Infinity}')
+    assert error is None
+    assert math.isnan(result["score"])
+    assert result["max"] == math.inf
+
+
+class _Payload(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the HTTP client at an empty on-disk cache."""
+    cache = FanoutCache(str(tmp_path / "http_cache"), shards=2)
+    monkeypatch.setattr(http_client, "get_cache", lambda: cache)
+    monkeypatch.setattr(http_client, "_memory_cache", OrderedDict())
+    yield cache
+    http_client.flush_cache_writes()
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_parsing(isolated_cache):
+    """A disk cache hit rebuilds the model from its stored validated form."""
+    with patch.object(
+        http_client, "call_http", return_value=(200, '{"name": "BRAF"}')
+    ):
+        first = await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            response_model_type=_Payload,
+            cache_ttl=60,
+        )
+    assert first == (_Payload(name="BRAF"), None)
+
+    # Simulate a fresh process: nothing held in memory
+    http_client.flush_cache_writes()
+    http_client._memory_cache.clear()
+    with (
+        patch.object(http_client, "call_http") as mock_call,
+        patch.object(http_client, "parse_response") as mock_parse,
+    ):
+        second = await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            response_model_type=_Payload,
+            cache_ttl=60,
+        )
+    mock_call.assert_not_called()
+    mock_parse.assert_not_called()
+    assert second == (_Payload(name="BRAF"), None)
+
+
+def test_cached_result_falls_back_to_raw_content(isolated_cache):
+    """Raw entries without a parsed copy are still served."""
+    http_client.cache_response("key", '{"name": "TP53"}', 60)
+    assert http_client.get_cached_result("key", _Payload) == (
+        _Payload(name="TP53"),
+        None,
+    )
+    assert http_client.get_cached_result("missing", None) is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_write_does_not_block_response(isolated_cache):
+    """request_api returns while the disk write is still pending."""
+    release = threading.Event()
+    real_set = isolated_cache.set
+
+    def slow_set(*args, **kwargs):
+        release.wait(5)
+        return real_set(*args, **kwargs)
+
+    with (
+        patch.object(isolated_cache, "set", side_effect=slow_set),
+        patch.object(
+            http_client, "call_http", return_value=(200, '{"name": "BRAF"}')
+        ),
+    ):
+        result = await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            cache_ttl=60,
+        )
+        assert result == ({"name": "BRAF"}, None)
+        assert http_client._pending_cache_writes
+        release.set()
+        http_client.flush_cache_writes()
+
+    assert not http_client._pending_cache_writes
+    key = generate_cache_key(
+        "GET", "https://api.example.com/gene", {"q": "BRAF"}
+    )
+    assert isolated_cache.get(key) == '{"name": "BRAF"}'
+
+
+def test_disk_cache_write_inline_when_backlogged(isolated_cache, monkeypatch):
+    """Past the backlog limit, writes happen before returning."""
+    monkeypatch.setattr(http_client, "CACHE_WRITE_BACKLOG", 0)
+    http_client.cache_response("a", "A", 60)
+    assert not http_client._pending_cache_writes
+    assert isolated_cache.get("a") == "A"
+
+
+def test_queued_disk_writes_share_one_transaction(isolated_cache):
+    """Writes queued before the writer runs are committed together."""
+    with (
+        patch.object(http_client._cache_writer, "submit") as mock_submit,
+        patch.object(
+            isolated_cache, "transact", wraps=isolated_cache.transact
+        ) as mock_transact,
+    ):
+        for key in ("a", "b", "c"):
+            http_client.cache_response(key, key.upper(), 60)
+        assert mock_submit.call_count == 3
+
+        http_client._drain_cache_writes()
+
+    mock_transact.assert_called_once()
+    assert [isolated_cache.get(k) for k in ("a", "b", "c")] == ["A", "B", "C"]
+    assert not http_client._queued_cache_writes
+
+
+class _Hits(BaseModel):
+    hits: list[int]
+
+
+def test_parsed_cache_snapshot_ignores_later_mutation(isolated_cache):
+    """Mutating a returned object does not change the cached copy."""
+    parsed = _Hits(hits=[1])
+    http_client.cache_parsed_response("key", _Hits, parsed, 60)
+    parsed.hits.append(2)
+    http_client.flush_cache_writes()
+
+    assert http_client.get_cached_result("key", _Hits) == (
+        _Hits(hits=[1]),
+        None,
+    )
+
+
+def test_parsed_cache_revalidates_against_current_model(isolated_cache):
+    """An entry stored under an older model definition is not trusted."""
+    http_client.cache_response("key", '{"name": "TP53", "size": 3}', 60)
+    http_client.flush_cache_writes()
+    http_client._memory_cache.clear()
+
+    class _Sized(BaseModel):
+        name: str
+        size: int
+
+    # The stored form predates the required "size" field
+    isolated_cache.set(
+        http_client._parsed_cache_key("key", _Sized), '{"name": "TP53"}'
+    )
+    assert http_client.get_cached_result("key", _Sized) == (
+        _Sized(name="TP53", size=3),
+        None,
+    )
+
+
+def test_parsed_cache_skips_models_that_do_not_round_trip(isolated_cache):
+    """Fields excluded from serialization would be lost, so none is stored."""
+
+    class _Hidden(BaseModel):
+        name: str
+        raw: str = Field("", exclude=True)
+
+    http_client.cache_parsed_response(
+        "key", _Hidden, _Hidden(name="TP53", raw="x"), 60
+    )
+    http_client.flush_cache_writes()
+    assert http_client._parsed_cache_key("key", _Hidden) not in isolated_cache
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_hit_skips_disk(isolated_cache):
+    """Repeated lookups within a process are served from memory."""
+    with patch.object(
+        http_client, "call_http", return_value=(200, '{"name": "BRAF"}')
+    ):
+        await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            cache_ttl=60,
+        )
+
+    with (
+        patch.object(http_client, "call_http") as mock_call,
+        patch.object(http_client, "get_cache") as mock_disk,
+    ):
+        result = await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            cache_ttl=60,
+        )
+    mock_call.assert_not_called()
+    mock_disk.assert_not_called()
+    assert result == ({"name": "BRAF"}, None)
+
+
+def test_memory_cache_is_bounded_lru(isolated_cache, monkeypatch):
+    """The least recently used entry is evicted past the size limit."""
+    monkeypatch.setattr(http_client, "MEMORY_CACHE_SIZE", 2)
+    http_client.cache_response("a", "A", 60)
+    http_client.cache_response("b", "B", 60)
+    assert http_client.get_cached_response("a") == "A"
+    http_client.cache_response("c", "C", 60)
+
+    assert list(http_client._memory_cache) == ["a", "c"]
+    # Evicted entries are still read back from disk
+    http_client.flush_cache_writes()
+    assert http_client.get_cached_response("b") == "B"
+    assert list(http_client._memory_cache) == ["a", "c"]
+
+
+def test_memory_cache_respects_expiry(isolated_cache):
+    """Expired in-memory entries are dropped rather than served."""
+    http_client._memory_cache["k"] = ("stale", 0.0)
+    assert http_client._recall("k") is None
+    assert "k" not in http_client._memory_cache
+
+
+def test_memory_cache_disabled(isolated_cache, monkeypatch):
+    """A size of zero keeps nothing in memory."""
+    monkeypatch.setattr(http_client, "MEMORY_CACHE_SIZE", 0)
+    http_client.cache_response("a", "A", 60)
+    http_client.flush_cache_writes()
+    assert not http_client._memory_cache
+    assert http_client.get_cached_response("a") == "A"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(isolated_cache):
+    """Concurrent cache misses for the same request hit the network once."""
+    calls = 0
+
+    async def slow_call(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 200, '{"name": "BRAF"}'
+
+    with patch.object(http_client, "call_http", side_effect=slow_call):
+        results = await asyncio.gather(*[
+            http_client.request_api(
+                url="https://api.example.com/gene",
+                request={"q": "BRAF"},
+                cache_ttl=60,
+            )
+            for _ in range(5)
+        ])
+
+    assert calls == 1
+    assert all(r == ({"name": "BRAF"}, None) for r in results)
+    # Each caller gets its own parsed object
+    assert results[0][0] is not results[1][0]
+    assert not http_client._inflight
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_reaches_every_caller(isolated_cache):
+    """An error from the shared call is raised to all waiting callers."""
+    with patch.object(
+        http_client, "call_http", side_effect=ConnectionError("down")
+    ):
+        results = await asyncio.gather(
+            *[
+                http_client.request_api(
+                    url="https://api.example.com/gene",
+                    request={"q": "BRAF"},
+                    cache_ttl=60,
+                )
+                for _ in range(2)
+            ],
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert not http_client._inflight
+
+
+def test_ssl_context_shared_per_tls_version():
+    """The same context is reused so pooled connections can be too."""
+    ctx = http_client.get_ssl_context(TLSVersion.TLSv1_2)
+    assert http_client.get_ssl_context(TLSVersion.TLSv1_2) is ctx
+    assert ctx.minimum_version == ctx.maximum_version == TLSVersion.TLSv1_2
+    assert http_client.get_ssl_context(TLSVersion.TLSv1_3) is not ctx
+
+
+@pytest.mark.parametrize(
+    "enable_retry, domain, expected_attempts",
+    [
+        (False, "pubmed", None),
+        (True, "pubmed", AGGRESSIVE_MAX_RETRY_ATTEMPTS),
+        (True, "clinicaltrials", AGGRESSIVE_MAX_RETRY_ATTEMPTS),
+        (True, "biothings", DEFAULT_MAX_RETRY_ATTEMPTS),
+        (True, None, DEFAULT_MAX_RETRY_ATTEMPTS),
+    ],
+)
+def test_retry_config_by_domain(enable_retry, domain, expected_attempts):
+    """Shared retry configs are chosen per domain."""
+    config = http_client._get_retry_config(enable_retry, domain)
+    if expected_attempts is None:
+        assert config is None
+    else:
+        assert config.max_attempts == expected_attempts
+        assert http_client._get_retry_config(True, domain) is config
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("[1, 2]", [1, 2]),
+        ("a,b\n1,2\n", [{"a": "1", "b": "2"}]),
+        ("plain text", {"text": "plain text"}),
+        ("x" * 5000 + ",", {"text": "x" * 5000 + ","}),
+    ],
+)
+def test_parse_response_sniffs_format(content, expected):
+    """JSON, CSV and plain text are told apart from the leading content."""
+    assert parse_response(200, content) == (expected, None)
+
+
+@pytest.mark.parametrize("content", ["", "   \n\t"])
+def test_parse_response_empty(content):
+    """Blank bodies are reported as empty responses."""
+    result, error = parse_response(200, content)
+    assert result is None
+    assert error.message == "Empty response received from API"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_token_only_spent_on_network_calls(isolated_cache):
+    """Cache hits and coalesced waiters do not consume rate-limit tokens."""
+
+    async def slow_call(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return 200, '{"name": "BRAF"}'
+
+    request = {
+        "url": "https://api.example.com/gene",
+        "request": {"q": "BRAF"},
+        "cache_ttl": 60,
+        "domain": "mygene",
+    }
+    with (
+        patch.object(http_client, "call_http", side_effect=slow_call),
+        patch.object(http_client.domain_limiter, "acquire") as mock_acquire,
+    ):
+        await asyncio.gather(*[
+            http_client.request_api(**request) for _ in range(3)
+        ])
+        await http_client.request_api(**request)
+        await http_client.request_api(**{**request, "cache_ttl": 0})
+
+    assert mock_acquire.await_count == 2
+    mock_acquire.assert_awaited_with("mygene")
+
+
+@pytest.mark.asyncio
+async def test_post_body_is_compact_json(monkeypatch):
+    """POST bodies are pre-encoded and sent with a JSON content type."""
+    monkeypatch.setenv("BIOMCP_USE_CONNECTION_POOL", "false")
+    response = MagicMock(status_code=200, text='{"ok": true}')
+    with patch(
+        "biomcp.http_client_simple.httpx.AsyncClient"
+    ) as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client.post.return_value = response
+        mock_client_class.return_value = mock_client
+
+        status, text = await execute_http_request(
+            "POST", "https://a", {"q": "é", "n": 1}, verify=True
+        )
+
+    assert (status, text) == (200, '{"ok": true}')
+    kwargs = mock_client.post.call_args.kwargs
+    assert json.loads(kwargs["content"]) == {"q": "é", "n": 1}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_query_items_match_httpx_encoding():
+    """The aiohttp backend encodes query params exactly like httpx."""
+    from urllib.parse import urlencode
+
+    params = {"q": "BRAF V600E", "flag": True, "off": False, "none": None}
+    params |= {"ids": ["a", "b"], "size": 10, "score": 0.5}
+    assert urlencode(http_client_simple._query_items(params)) == str(
+        httpx.QueryParams(params)
+    )
+
+
+@pytest.mark.parametrize(
+    "backend,available,expected",
+    [
+        ("aiohttp", True, True),
+        ("AIOHTTP", True, True),
+        ("aiohttp", False, False),
+        ("httpx", True, False),
+    ],
+)
+def test_aiohttp_backend_is_opt_in(monkeypatch, backend, available, expected):
+    """aiohttp is only used when requested and installed."""
+    monkeypatch.setenv("BIOMCP_HTTP_BACKEND", backend)
+    monkeypatch.setattr(http_client_simple, "AIOHTTP_AVAILABLE", available)
+    assert http_client_simple.use_aiohttp_backend() is expected
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_round_trip(monkeypatch):
+    """GET params and POST bodies reach the server through aiohttp."""
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def echo(request):
+        return web.json_response({
+            "query": sorted(request.query.items()),
+            "body": await request.text(),
+            "type": request.content_type,
+        })
+
+    app = web.Application()
+    app.router.add_route("*", "/echo", echo)
+    monkeypatch.setenv("BIOMCP_HTTP_BACKEND", "aiohttp")
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/echo"))
+        try:
+            status, text = await execute_http_request(
+                "GET", url, {"q": "BRAF", "exact": True}, verify=True
+            )
+            assert status == 200
+            assert json.loads(text)["query"] == [
+                ["exact", "true"],
+                ["q", "BRAF"],
+            ]
+
+            status, text = await execute_http_request(
+                "POST", url, {"q": "BRAF"}, verify=True
+            )
+            assert status == 200
+            assert json.loads(json.loads(text)["body"]) == {"q": "BRAF"}
+            assert json.loads(text)["type"] == "application/json"
+        finally:
+            await close_all_pools()
+
+
+@pytest.mark.parametrize(
+    "legacy, headers, expected",
+    [
+        (None, {"A": "1"}, {"A": "1"}),
+        ('{"A": "1"}', None, {"A": "1"}),
+        ({"A": "1", "B": "2"}, {"A": "3"}, {"A": "3", "B": "2"}),
+        ("not json", None, None),
+    ],
+)
+def test_prepare_request_params_headers(legacy, headers, expected):
+    """Headers come from the kwarg or a legacy "_headers" entry, parsed once."""
+    request = {"q": "x"}
+    if legacy is not None:
+        request["_headers"] = legacy
+
+    params, merged = http_client._prepare_request_params(request, headers)
+
+    assert params == {"q": "x"}
+    assert merged == expected
+    # The caller's dict is left untouched
+    assert ("_headers" in request) is (legacy is not None)
+
+
+def test_prepare_request_params_does_not_copy_plain_dicts():
+    """Requests without legacy headers are used as-is."""
+    request = {"q": "x", "size": 10}
+    params, headers = http_client._prepare_request_params(request)
+    assert params is request
+    assert headers is None
+
+
+@pytest.mark.asyncio
+async def test_request_headers_reach_call_http_and_stay_unmodified(
+    isolated_cache,
+):
+    """request_api forwards headers without adding them to the cache key."""
+    headers = {"X-API-KEY": "secret"}
+    with patch.object(
+        http_client, "call_http", return_value=(200, "{}")
+    ) as mock_call:
+        await http_client.request_api(
+            url="https://api.example.com/gene",
+            request={"q": "BRAF"},
+            cache_ttl=60,
+            headers=headers,
+        )
+
+    assert mock_call.call_args.kwargs["headers"] == headers
+    key = generate_cache_key(
+        "GET", "https://api.example.com/gene", {"q": "BRAF"}
+    )
+    assert key in http_client._memory_cache
+
+
+@pytest.mark.asyncio
+async def test_call_http_reuses_static_breaker_config():
+    """Calls share one breaker per host and build no per-call config."""
+    with (
+        patch.object(
+            http_client, "execute_http_request", return_value=(200, "{}")
+        ),
+        patch.object(http_client, "CircuitBreakerConfig") as mock_config,
+        patch.object(
+            http_client,
+            "get_circuit_breaker",
+            wraps=http_client.get_circuit_breaker,
+        ) as mock_get_breaker,
+    ):
+        for _ in range(2):
+            assert await http_client.call_http(
+                "GET", "https://breaker.example.com/x", {}
+            ) == (200, "{}")
+
+    mock_config.assert_not_called()
+    assert mock_get_breaker.call_count == 2
+    for call in mock_get_breaker.call_args_list:
+        assert call.args[0] == "http_breaker.example.com"
+        assert call.args[1] is http_client._HTTP_BREAKER_CONFIG
+
+
+@pytest.mark.parametrize(
+    "responses,expected,attempts",
+    [
+        ([(503, "busy"), (200, "{}")], (200, "{}"), 2),
+        ([(503, "busy")] * 3, (503, "busy"), 3),
+        ([(404, "missing"), (200, "{}")], (404, "missing"), 1),
+    ],
+)
+@pytest.mark.asyncio
+async def test_call_http_retries_retryable_statuses(
+    responses, expected, attempts
+):
+    """Retryable statuses are retried; the last response is returned."""
+    config = RetryConfig(max_attempts=3, initial_delay=0, jitter=False)
+    with patch.object(
+        http_client, "execute_http_request", side_effect=responses
+    ) as mock_execute:
+        result = await http_client.call_http(
+            "GET", "https://retry.example.com/x", {}, retry_config=config
+        )
+
+    assert result == expected
+    assert mock_execute.call_count == attempts
+
+
+@pytest.mark.asyncio
+async def test_call_http_bounds_concurrency_per_host(monkeypatch):
+    """A saturated host does not hold up requests to other hosts."""
+    monkeypatch.setattr(
+        http_client, "host_limiter", rate_limiter.HostLimiter(2)
+    )
+    release = asyncio.Event()
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fake_execute(method, url, params, verify, headers):
+        host = url.split("/")[2]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        if host == "slow.example.com":
+            await release.wait()
+        in_flight[host] -= 1
+        return 200, "{}"
+
+    with patch.object(http_client, "execute_http_request", fake_execute):
+        slow = [
+            asyncio.create_task(
+                http_client.call_http("GET", "https://slow.example.com/x", {})
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        fast = await asyncio.wait_for(
+            http_client.call_http("GET", "https://fast.example.com/x", {}),
+            timeout=1,
+        )
+        assert fast == (200, "{}")
+        assert in_flight["slow.example.com"] == 2
+
+        release.set()
+        assert await asyncio.gather(*slow) == [(200, "{}")] * 5
+
+    assert peak["slow.example.com"] == 2
@@ -238,6 +238,25 @@ class TestMCPIntegration:
 
         assert "Unknown domain" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "tool,arguments",
+        [
+            ("openfda_approval_searcher", {"approval_year": "24"}),
+            ("openfda_recall_searcher", {"since_date": "2024-01-01"}),
+        ],
+    )
+    async def test_mcp_rejects_malformed_dates(self, tool, arguments):
+        """Malformed date filters are rejected before any API call."""
+        from mcp.server.fastmcp.exceptions import ToolError
+
+        with (
+            patch("biomcp.openfda.utils.request_api") as mock_api,
+            pytest.raises(ToolError, match="should match pattern"),
+        ):
+            await mcp_app.call_tool(tool, arguments)
+
+        mock_api.assert_not_called()
+
     async def test_mcp_fetch_all_trial_sections(self):
         """Test fetching trial with all sections through MCP."""
         mock_protocol = {"title": "Test Trial", "nct_id": "NCT123"}
@@ -1,11 +1,18 @@
 """Tests for MCP tool wrappers."""
 
+import asyncio
 import json
 from unittest.mock import patch
 
 import pytest
 
 from biomcp.articles.search import _article_searcher
+from biomcp.individual_tools import (
+    article_searcher,
+    trial_getter,
+    trial_searcher,
+    variant_searcher,
+)
 
 
 class TestArticleSearcherMCPTool:
@@ -109,3 +116,177 @@ class TestArticleSearcherMCPTool:
             assert kwargs["chemicals"] == ""
             assert kwargs["diseases"] == ""
             assert kwargs["genes"] == ""
+
+
+class TestTrialGetterMCPTool:
+    """Test the trial_getter MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_trial_getter_fetches_sections_concurrently(self):
+        """Sections are fetched together and joined in a fixed order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        def section(name):
+            async def fetch(call_benefit, nct_id):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return f"{name} {nct_id}"
+
+            return fetch
+
+        with (
+            patch(
+                "biomcp.individual_tools._trial_protocol", section("protocol")
+            ),
+            patch(
+                "biomcp.individual_tools._trial_locations",
+                section("locations"),
+            ),
+            patch(
+                "biomcp.individual_tools._trial_outcomes", section("outcomes")
+            ),
+            patch(
+                "biomcp.individual_tools._trial_references",
+                section("references"),
+            ),
+        ):
+            result = await trial_getter(nct_id="NCT00000001")
+
+        assert max_in_flight == 4
+        assert result == (
+            "protocol NCT00000001\n\nlocations NCT00000001\n\n"
+            "outcomes NCT00000001\n\nreferences NCT00000001"
+        )
+
+    @pytest.mark.asyncio
+    async def test_trial_getter_skips_failed_sections(self):
+        """A failing section is left out instead of failing the tool."""
+        with (
+            patch(
+                "biomcp.individual_tools._trial_protocol",
+                return_value="protocol",
+            ),
+            patch(
+                "biomcp.individual_tools._trial_locations",
+                side_effect=ConnectionError("down"),
+            ),
+            patch("biomcp.individual_tools._trial_outcomes", return_value=""),
+            patch(
+                "biomcp.individual_tools._trial_references",
+                return_value="references",
+            ),
+        ):
+            result = await trial_getter(nct_id="NCT00000001")
+
+        assert result == "protocol\n\nreferences"
+
+
+class TestArticleSearcherCBioPortal:
+    """Test the cBioPortal summary in the article_searcher tool."""
+
+    @pytest.mark.asyncio
+    async def test_summary_fetched_alongside_search(self):
+        """The summary request does not wait for the article search."""
+        summary_started = asyncio.Event()
+
+        async def search(**kwargs):
+            # Only completes if the summary request is already running
+            await asyncio.wait_for(summary_started.wait(), timeout=1)
+            return "## Articles"
+
+        async def summary(genes, request_params):
+            summary_started.set()
+            return "## cBioPortal"
+
+        with (
+            patch("biomcp.individual_tools._article_searcher", search),
+            patch(
+                "biomcp.individual_tools.get_cbioportal_summary_for_genes",
+                summary,
+            ),
+        ):
+            result = await article_searcher(genes="BRAF")
+
+        assert result == "## cBioPortal\n\n---\n\n## Articles"
+
+
+class TestSearchersWithoutCriteria:
+    """Searchers return early when given nothing to search for."""
+
+    @pytest.mark.asyncio
+    async def test_article_searcher_without_criteria(self):
+        """No article search is made without criteria."""
+        with patch("biomcp.individual_tools._article_searcher") as mock_search:
+            result = await article_searcher(genes="", keywords=[])
+
+        assert result == "No search criteria provided."
+        mock_search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_variant_searcher_without_criteria(self):
+        """No variant search is made without criteria."""
+        with patch("biomcp.individual_tools._variant_searcher") as mock_search:
+            result = await variant_searcher(gene="")
+
+        assert result == "No search criteria provided."
+        mock_search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_variant_searcher_zero_filter_is_criteria(self):
+        """A numeric filter of 0 still counts as a search criterion."""
+        with patch(
+            "biomcp.individual_tools._variant_searcher",
+            return_value="## Variants",
+        ) as mock_search:
+            result = await variant_searcher(frequency_min=0.0)
+
+        assert result == "## Variants"
+        assert mock_search.call_args.kwargs["min_frequency"] == 0.0
+
+
+class TestTrialSearcherMCPTool:
+    """Test the trial_searcher MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_hash_is_passed_through(self):
+        """The page token reaches the ClinicalTrials.gov query."""
+        with patch(
+            "biomcp.individual_tools._trial_searcher", return_value="## Trials"
+        ) as mock_search:
+            await trial_searcher(
+                conditions="melanoma", next_page_hash="NF0g5JGBlPMuwQY"
+            )
+
+        kwargs = mock_search.call_args.kwargs
+        assert kwargs["next_page_hash"] == "NF0g5JGBlPMuwQY"
+        assert kwargs["conditions"] == ["melanoma"]
+
+
+class TestVariantSearcherFilters:
+    """Test variant_searcher filter values."""
+
+    @pytest.mark.asyncio
+    async def test_prediction_filters_map_to_myvariant_codes(self):
+        """Tool filter names become the codes MyVariant.info stores."""
+        with patch(
+            "biomcp.variants.search.search_variants",
+            return_value="## Variants",
+        ) as mock_search:
+            await variant_searcher(
+                gene="BRAF",
+                significance="conflicting",
+                sift_prediction="deleterious",
+                polyphen_prediction="probably_damaging",
+                include_cbioportal=False,
+            )
+
+        query = mock_search.call_args.args[0]
+        assert query.sift == "D"
+        assert query.polyphen == "D"
+        assert query.significance == (
+            "conflicting interpretations of pathogenicity"
+        )
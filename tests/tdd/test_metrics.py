@@ -120,6 +120,26 @@ async def test_metrics_collector():
     assert summary is None
 
 
+@pytest.mark.asyncio
+async def test_metrics_collector_warns_on_slow_call(caplog):
+    """Calls far slower than the metric's P95 are logged."""
+    collector = MetricsCollector()
+
+    # Too few samples for a P95 yet
+    await collector.record("api_call", 5.0)
+    for _ in range(19):
+        await collector.record("api_call", 0.1)
+    assert "Slow call" not in caplog.text
+
+    with caplog.at_level("WARNING", logger="biomcp.metrics"):
+        await collector.record("api_call", 0.15)
+        await collector.record("api_call", 1.0, tags={"host": "example.com"})
+
+    assert caplog.text.count("Slow call: api_call") == 1
+    assert "took 1000ms" in caplog.text
+    assert "example.com" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_global_metrics_functions():
     """Test global metrics functions."""
@@ -189,6 +209,21 @@ async def test_track_performance_decorator_async_error():
     assert summary.error_count == 1
 
 
+def test_track_performance_disabled_returns_function(monkeypatch):
+    """With metrics disabled, decorated functions are left unwrapped."""
+    import importlib
+
+    import biomcp.metrics
+
+    monkeypatch.setenv("BIOMCP_METRICS_ENABLED", "false")
+    importlib.reload(biomcp.metrics)
+
+    async def tool():
+        return "ok"
+
+    assert biomcp.metrics.track_performance("test.tool")(tool) is tool
+
+
 def test_track_performance_decorator_sync():
     """Test track_performance decorator on sync functions."""
 
@@ -39,10 +39,10 @@ class TestCTSAPIIntegration:
             assert result == {"data": "test"}
             mock_request.assert_called_once()
 
-            # Verify headers were included
+            # Verify headers were passed directly, not inside the params
             call_args = mock_request.call_args
-            request_data = call_args.kwargs["request"]
-            assert "_headers" in request_data
+            assert call_args.kwargs["headers"]["x-api-key"] == "test-key"
+            assert "_headers" not in call_args.kwargs["request"]
 
 
 class TestOrganizationsModule:
@@ -87,6 +87,28 @@ class TestOrganizationsModule:
             assert result["name"] == "Test Cancer Center"
             assert result["type"] == "Academic"
 
+    @pytest.mark.asyncio
+    async def test_get_organization_caches_server_key_lookups(
+        self, monkeypatch
+    ):
+        """Repeat lookups with the server key skip the API; caller keys don't."""
+        monkeypatch.setenv("NCI_API_KEY", "server-key")
+        with patch(
+            "biomcp.organizations.getter.make_cts_request"
+        ) as mock_request:
+            mock_request.return_value = {
+                "data": {"id": "ORG001", "name": "Test Cancer Center"}
+            }
+
+            first = await get_organization("ORG001")
+            first["name"] = "Mutated by caller"
+            second = await get_organization("ORG001", api_key="server-key")
+            assert second["name"] == "Test Cancer Center"
+            assert mock_request.call_count == 1
+
+            await get_organization("ORG001", api_key="caller-key")
+            assert mock_request.call_count == 2
+
 
 class TestInterventionsModule:
     """Test interventions module functions."""
@@ -62,6 +62,32 @@ async def test_offline_mode_allows_cached_responses():
         assert error is None
 
 
+@pytest.mark.asyncio
+async def test_offline_mode_cache_key_ignores_headers():
+    """Test that requests carrying _headers hit the cache offline."""
+    request = {"test": "data", "_headers": '{"X-API-KEY": "secret"}'}
+    with (
+        patch.dict(os.environ, {"BIOMCP_OFFLINE": "false"}),
+        patch("biomcp.http_client.call_http") as mock_call,
+    ):
+        mock_call.return_value = (200, '{"data": "with-headers"}')
+        await request_api(
+            url="https://api.example.com/headers",
+            request=dict(request),
+            cache_ttl=3600,
+        )
+
+    with patch.dict(os.environ, {"BIOMCP_OFFLINE": "true"}):
+        result, error = await request_api(
+            url="https://api.example.com/headers",
+            request=dict(request),
+            cache_ttl=3600,
+        )
+
+    assert result == {"data": "with-headers"}
+    assert error is None
+
+
 @pytest.mark.asyncio
 async def test_offline_mode_case_insensitive():
     """Test that offline mode environment variable is case insensitive."""